@@ -349,14 +349,9 @@ def batch(
                 total=queue.pending_count
             )
 
-            completed_count = [0]  # Use list to allow modification in closure
-
             def progress_callback(current: int, total: int, message: str):
-                # Update progress bar manually when callback is invoked
-                new_completed = current - completed_count[0]
-                if new_completed > 0:
-                    progress.update(task, advance=new_completed)
-                    completed_count[0] = current
+                # BatchProcessor calls back once per finished task
+                progress.update(task, advance=1)
 
             results = processor.process(queue, progress_callback)
 
@@ -5,32 +5,44 @@ Real-time monitoring of CPU, memory, and conversion progress.
 Helps identify bottlenecks and optimal configurations.
 """
 
+import itertools
 import psutil
+import signal
+import sys
 import time
 import threading
-from typing import Optional, Callable, Dict, List
+from typing import Optional, Callable, Dict, Iterator, List, Tuple
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Offset mapping time.monotonic_ns() onto wall-clock epoch nanoseconds,
+# captured once so snapshots only need a monotonic stamp
+_EPOCH_OFFSET_NS = time.time_ns() - time.monotonic_ns()
 
-@dataclass
+
+@dataclass(slots=True)
 class PerformanceSnapshot:
     """Single snapshot of system performance."""
-    timestamp: datetime
+    monotonic_ns: int
     cpu_percent: float
     memory_available_gb: float
     memory_percent: float
-    memory_used_gb: float
+    memory_used_gb: float  # Resident set size of the monitored process
     disk_io_read_mb: float
     disk_io_write_mb: float
     conversion_progress: Optional[float] = None
     conversion_message: Optional[str] = None
 
+    @property
+    def timestamp(self) -> datetime:
+        """Wall-clock time of the snapshot (derived from the monotonic stamp)."""
+        return datetime.fromtimestamp((self.monotonic_ns + _EPOCH_OFFSET_NS) / 1e9)
+
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceStats:
     """Aggregated performance statistics."""
     duration_seconds: float
@@ -49,6 +61,53 @@ class PerformanceStats:
         return 0.0
 
 
+class _SpscRing:
+    """
+    Bounded single-producer/single-consumer ring buffer without locks.
+
+    The producer only advances ``_tail`` and the consumer only advances
+    ``_head``; each index is written by exactly one thread, and reference
+    assignment is atomic in CPython, so no lock is needed. When full, the
+    producer overwrites its newest unread slot instead of blocking, so the
+    latest value is never lost.
+    """
+
+    __slots__ = ("_slots", "_mask", "_head", "_tail")
+
+    def __init__(self, capacity_pow2: int = 6):
+        """
+        Initialize ring buffer.
+
+        Args:
+            capacity_pow2: Capacity as a power of two (default 64 slots)
+        """
+        capacity = 1 << capacity_pow2
+        self._slots: List[Optional[Tuple[float, str]]] = [None] * capacity
+        self._mask = capacity - 1
+        self._head = 0
+        self._tail = 0
+
+    def push(self, item: Tuple[float, str]) -> None:
+        """Publish an item (producer thread only)."""
+        tail = self._tail
+        if tail - self._head > self._mask:
+            # Full: replace the newest unread item
+            self._slots[(tail - 1) & self._mask] = item
+            return
+        self._slots[tail & self._mask] = item
+        self._tail = tail + 1
+
+    def drain_latest(self) -> Optional[Tuple[float, str]]:
+        """Consume all pending items and return the newest (consumer thread only)."""
+        head = self._head
+        tail = self._tail
+        if head == tail:
+            return None
+        item = self._slots[(tail - 1) & self._mask]
+        self._head = tail
+        return item
+
+
 class PerformanceMonitor:
     """
     Real-time performance monitor for conversion process.
@@ -70,7 +129,8 @@ class PerformanceMonitor:
     def __init__(
         self,
         sample_interval: float = 1.0,
-        enable_disk_monitoring: bool = True
+        enable_disk_monitoring: bool = True,
+        use_signal_timer: bool = False
     ):
         """
         Initialize performance monitor.
@@ -78,22 +138,56 @@ class PerformanceMonitor:
         Args:
             sample_interval: Time between samples (seconds)
             enable_disk_monitoring: Whether to track disk I/O
+            use_signal_timer: Sample from a SIGALRM interval timer on the
+                main thread instead of a background thread (POSIX only;
+                falls back to the thread elsewhere)
         """
         self.sample_interval = sample_interval
         self.enable_disk_monitoring = enable_disk_monitoring
+        self.use_signal_timer = use_signal_timer
 
         self.snapshots: List[PerformanceSnapshot] = []
         self._running = False
         self._thread: Optional[threading.Thread] = None
+        # Set by stop() to wake the monitor thread without waiting out a tick
+        self._stop_event = threading.Event()
+
+        # Signal timer state
+        self._timer_active = False
+        self._previous_handler = None
+        self._timer_error: Optional[Exception] = None
 
         # Initial disk I/O counters
         self._initial_disk_io = None
 
+        # Disk counters and system-wide memory change slowly, so poll them
+        # at ~1 Hz regardless of sample_interval and reuse the last values
+        self._slow_sample_every = max(1, round(1.0 / sample_interval)) if sample_interval > 0 else 1
+
+        # Sampling function specialized in start(); see _build_sampler
+        self._sampler: Optional[Callable[[Optional[float]], None]] = None
+
         # Progress callback
         self._progress_callback: Optional[Callable[[float, str], None]] = None
 
+        # (progress, message) updates from the conversion thread, drained by
+        # the sampler; the last drained pair is kept for later snapshots
+        self._progress_ring = _SpscRing()
+        self._latest_progress: Optional[Tuple[float, str]] = None
+
+        # Running aggregates (count, cpu_sum, cpu_max, mem_sum, mem_max),
+        # published as one tuple so get_statistics() never rescans snapshots
+        self._aggregates: Tuple[int, float, float, float, float] = (0, 0.0, 0.0, 0.0, 0.0)
+
+    def _can_use_signal_timer(self) -> bool:
+        """Check whether SIGALRM sampling is possible in this context."""
+        return (
+            hasattr(signal, "setitimer")
+            and threading.current_thread() is threading.main_thread()
+        )
+
     def start(self):
-        """Start monitoring in background thread."""
+        """Start monitoring (signal timer or background thread)."""
         if self._running:
             logger.warning("Monitor is already running")
             return
@@ -103,6 +197,22 @@ class PerformanceMonitor:
         if self.enable_disk_monitoring:
             self._initial_disk_io = psutil.disk_io_counters()
 
+        self._sampler = self._build_sampler()
+
+        if self.use_signal_timer and self._can_use_signal_timer():
+            # Prime cpu_percent so non-blocking samples are meaningful
+            psutil.cpu_percent(interval=None)
+            self._timer_error = None
+            self._previous_handler = signal.signal(signal.SIGALRM, self._timer_handler)
+            signal.setitimer(signal.ITIMER_REAL, self.sample_interval, self.sample_interval)
+            self._timer_active = True
+            logger.info("Performance monitoring started (signal timer)")
+            return
+
+        if self.use_signal_timer:
+            logger.debug("Signal timer unavailable, falling back to monitor thread")
+
+        self._stop_event.clear()
         self._thread = threading.Thread(target=self._monitor_loop, daemon=True)
         self._thread.start()
 
@@ -114,6 +224,16 @@ class PerformanceMonitor:
             return
 
         self._running = False
+        self._stop_event.set()
+
+        if self._timer_active:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, self._previous_handler or signal.SIG_DFL)
+            self._previous_handler = None
+            self._timer_active = False
+
+            if self._timer_error is not None:
+                logger.error(f"Error in monitoring timer: {self._timer_error}")
 
         if self._thread:
             self._thread.join(timeout=5.0)
@@ -121,51 +241,127 @@ class PerformanceMonitor:
 
         logger.info(f"Performance monitoring stopped. Collected {len(self.snapshots)} snapshots")
 
+    def _timer_handler(self, signum, frame):
+        """SIGALRM handler: take one non-blocking sample."""
+        try:
+            self._sampler(None)
+        except Exception as e:
+            # Logging is not safe inside a signal handler; report on stop()
+            self._timer_error = e
+
+    def _build_sampler(self) -> Callable[[Optional[float]], None]:
+        """
+        Build a sampling function specialized for the current settings.
+
+        Whether disk I/O is tracked is resolved once here instead of on
+        every sample, and psutil/time functions are bound as closure locals.
+        Memory used is the monitored process's RSS; system-wide memory and
+        disk counters are polled only on tick boundaries (~1 Hz).
+
+        Returns:
+            Function taking the cpu_percent interval (None = since last call)
+            that samples system metrics and appends a snapshot
+        """
+        cpu_percent_fn = psutil.cpu_percent
+        virtual_memory = psutil.virtual_memory
+        disk_io_counters = psutil.disk_io_counters
+        memory_info = psutil.Process().memory_info
+        monotonic_ns = time.monotonic_ns
+        append_snapshot = self.snapshots.append
+        drain_progress = self._progress_ring.drain_latest
+        slow_sample_every = self._slow_sample_every
+        gb = 1024**3
+        mb = 1024**2
+
+        tick = 0
+        system_memory = None
+
+        def record(cpu_percent: float, disk_read_mb: float, disk_write_mb: float):
+            nonlocal tick, system_memory
+
+            # Clamp so a bogus reading cannot skew the running aggregates
+            cpu_percent = min(max(cpu_percent, 0.0), 100.0)
+
+            if tick % slow_sample_every == 0:
+                system_memory = virtual_memory()
+            tick += 1
+
+            memory_used_gb = memory_info().rss / gb
+
+            snapshot = PerformanceSnapshot(
+                monotonic_ns=monotonic_ns(),
+                cpu_percent=cpu_percent,
+                memory_available_gb=system_memory.available / gb,
+                memory_percent=system_memory.percent,
+                memory_used_gb=memory_used_gb,
+                disk_io_read_mb=disk_read_mb,
+                disk_io_write_mb=disk_write_mb
+            )
+
+            # Attach the most recent conversion progress
+            latest_progress = drain_progress()
+            if latest_progress is None:
+                latest_progress = self._latest_progress
+            else:
+                self._latest_progress = latest_progress
+            if latest_progress is not None:
+                snapshot.conversion_progress, snapshot.conversion_message = latest_progress
+
+            count, cpu_sum, cpu_max, mem_sum, mem_max = self._aggregates
+            append_snapshot(snapshot)
+            self._aggregates = (
+                count + 1,
+                cpu_sum + cpu_percent,
+                max(cpu_max, cpu_percent),
+                mem_sum + memory_used_gb,
+                max(mem_max, memory_used_gb),
+            )
+
+        initial_io = self._initial_disk_io
+        if not (self.enable_disk_monitoring and initial_io):
+            def sample(cpu_interval: Optional[float]):
+                record(cpu_percent_fn(interval=cpu_interval), 0.0, 0.0)
+
+            return sample
+
+        # Disk I/O (since start), polled only on tick boundaries
+        initial_read = initial_io.read_bytes
+        initial_write = initial_io.write_bytes
+        last_disk_mb = (0.0, 0.0)
+
+        def sample_with_disk(cpu_interval: Optional[float]):
+            nonlocal last_disk_mb
+
+            cpu_percent = cpu_percent_fn(interval=cpu_interval)
+
+            if tick % slow_sample_every == 0:
+                current_io = disk_io_counters()
+                if current_io:
+                    # Counters can wrap or reset (e.g. disk removed); never go negative
+                    last_disk_mb = (
+                        max(0.0, (current_io.read_bytes - initial_read) / mb),
+                        max(0.0, (current_io.write_bytes - initial_write) / mb),
+                    )
+
+            record(cpu_percent, *last_disk_mb)
+
+        return sample_with_disk
+
     def _monitor_loop(self):
         """Background monitoring loop."""
-        process = psutil.Process()
-        system_memory = psutil.virtual_memory()
+        sample = self._sampler
+        wait_for_stop = self._stop_event.wait
+        interval = self.sample_interval
 
         while self._running:
             try:
-                # CPU usage
-                cpu_percent = psutil.cpu_percent(interval=0.1)
-
-                # Memory
-                system_memory = psutil.virtual_memory()
-                memory_available_gb = system_memory.available / (1024**3)
-                memory_percent = system_memory.percent
-                memory_used_gb = system_memory.used / (1024**3)
-
-                # Disk I/O (since start)
-                disk_read_mb = 0.0
-                disk_write_mb = 0.0
-
-                if self.enable_disk_monitoring and self._initial_disk_io:
-                    current_io = psutil.disk_io_counters()
-                    if current_io and self._initial_disk_io:
-                        disk_read_mb = (current_io.read_bytes - self._initial_disk_io.read_bytes) / (1024**2)
-                        disk_write_mb = (current_io.write_bytes - self._initial_disk_io.write_bytes) / (1024**2)
-
-                # Create snapshot
-                snapshot = PerformanceSnapshot(
-                    timestamp=datetime.now(),
-                    cpu_percent=cpu_percent,
-                    memory_available_gb=memory_available_gb,
-                    memory_percent=memory_percent,
-                    memory_used_gb=memory_used_gb,
-                    disk_io_read_mb=disk_read_mb,
-                    disk_io_write_mb=disk_write_mb
-                )
-
-                self.snapshots.append(snapshot)
-
-                # Sleep until next sample
-                time.sleep(self.sample_interval)
-
+                sample(0.1)
             except Exception as e:
                 logger.error(f"Error in monitoring loop: {e}")
-                time.sleep(self.sample_interval)
+
+            # Sleep until next sample; stop() ends the wait immediately
+            if wait_for_stop(interval):
+                break
 
     def set_progress_callback(self, callback: Callable[[float, str], None]):
         """
@@ -186,23 +382,31 @@ class PerformanceMonitor:
             progress: Progress value (0.0 to 1.0)
             message: Progress message
         """
-        if self.snapshots:
-            # Update latest snapshot with progress info
-            self.snapshots[-1].conversion_progress = progress
-            self.snapshots[-1].conversion_message = message
+        # Publish for the monitor thread; it is attached at the next sample
+        self._progress_ring.push((progress, message))
 
         # Forward to callback if set
         if self._progress_callback:
             self._progress_callback(progress, message)
 
-    def get_statistics(self) -> PerformanceStats:
+    def get_statistics(self, include_snapshots: bool = False) -> PerformanceStats:
         """
         Calculate aggregated statistics from snapshots.
 
+        Aggregates are maintained incrementally at sample time, so this is
+        O(1) unless a copy of the snapshots is requested. To walk the samples
+        without copying them, use iter_snapshots().
+
+        Args:
+            include_snapshots: Whether to attach a copy of the snapshot list
+                (PerformanceStats.snapshots is empty otherwise)
+
         Returns:
             PerformanceStats with aggregated metrics
         """
-        if not self.snapshots:
+        count, cpu_sum, cpu_max, mem_sum, mem_max = self._aggregates
+
+        if count == 0:
             return PerformanceStats(
                 duration_seconds=0,
                 cpu_avg=0,
@@ -213,56 +417,56 @@ class PerformanceMonitor:
             )
 
         # Time span
-        start_time = self.snapshots[0].timestamp
-        end_time = self.snapshots[-1].timestamp
-        duration = (end_time - start_time).total_seconds()
-
-        # CPU stats
-        cpu_values = [s.cpu_percent for s in self.snapshots]
-        cpu_avg = sum(cpu_values) / len(cpu_values)
-        cpu_max = max(cpu_values)
-
-        # Memory stats
-        memory_values = [s.memory_used_gb for s in self.snapshots]
-        memory_avg = sum(memory_values) / len(memory_values)
-        memory_max = max(memory_values)
-        memory_peak = memory_max  # Same as max for now
+        duration = (self.snapshots[-1].monotonic_ns - self.snapshots[0].monotonic_ns) / 1e9
 
         return PerformanceStats(
             duration_seconds=duration,
-            cpu_avg=cpu_avg,
+            cpu_avg=cpu_sum / count,
             cpu_max=cpu_max,
-            memory_avg_gb=memory_avg,
-            memory_max_gb=memory_max,
-            memory_peak_gb=memory_peak,
-            snapshots=self.snapshots.copy()
+            memory_avg_gb=mem_sum / count,
+            memory_max_gb=mem_max,
+            memory_peak_gb=mem_max,  # Same as max for now
+            snapshots=self.snapshots.copy() if include_snapshots else []
         )
 
+    def iter_snapshots(self) -> Iterator[PerformanceSnapshot]:
+        """
+        Iterate over collected snapshots without copying the list.
+
+        Returns:
+            Iterator over the snapshots collected so far
+        """
+        return itertools.islice(self.snapshots, self._aggregates[0])
+
     def print_summary(self):
         """Print performance summary."""
         stats = self.get_statistics()
 
-        print("\n" + "=" * 70)
-        print(" Performance Summary")
-        print("=" * 70)
-
-        print(f"\nDuration: {stats.duration_seconds:.1f} seconds")
-
-        print(f"\nCPU Usage:")
-        print(f"  Average: {stats.cpu_avg:.1f}%")
-        print(f"  Peak:    {stats.cpu_max:.1f}%")
-
-        print(f"\nMemory Usage:")
-        print(f"  Average: {stats.memory_avg_gb:.1f} GB")
-        print(f"  Peak:    {stats.memory_max_gb:.1f} GB")
+        lines = [
+            "\n" + "=" * 70,
+            " Performance Summary",
+            "=" * 70,
+            f"\nDuration: {stats.duration_seconds:.1f} seconds",
+            "\nCPU Usage:",
+            f"  Average: {stats.cpu_avg:.1f}%",
+            f"  Peak:    {stats.cpu_max:.1f}%",
+            "\nProcess RSS:",
+            f"  Average: {stats.memory_avg_gb:.1f} GB",
+            f"  Peak:    {stats.memory_max_gb:.1f} GB",
+        ]
+
+        if self.enable_disk_monitoring and self.snapshots:
+            final_snapshot = self.snapshots[-1]
+            lines.extend([
+                "\nDisk I/O:",
+                f"  Read:  {final_snapshot.disk_io_read_mb:.1f} MB",
+                f"  Write: {final_snapshot.disk_io_write_mb:.1f} MB",
+            ])
 
-        if self.enable_disk_monitoring and stats.snapshots:
-            final_snapshot = stats.snapshots[-1]
-            print(f"\nDisk I/O:")
-            print(f"  Read:  {final_snapshot.disk_io_read_mb:.1f} MB")
-            print(f"  Write: {final_snapshot.disk_io_write_mb:.1f} MB")
+        lines.append("\n" + "=" * 70 + "\n")
 
-        print("\n" + "=" * 70 + "\n")
+        # One write instead of a print() per line
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def print_detailed_timeline(self):
         """Print detailed timeline of snapshots."""
@@ -270,26 +474,30 @@ class PerformanceMonitor:
             print("No snapshots available")
             return
 
-        print("\n" + "=" * 100)
-        print(" Detailed Performance Timeline")
-        print("=" * 100)
+        lines = [
+            "\n" + "=" * 100,
+            " Detailed Performance Timeline",
+            "=" * 100,
+            f"\n{'Time':<20} {'CPU%':<8} {'RSS(GB)':<12} {'SysMem%':<8} {'DiskR(MB)':<12} {'DiskW(MB)':<12} {'Progress':<12}",
+            "-" * 100,
+        ]
 
-        print(f"\n{'Time':<20} {'CPU%':<8} {'Mem(GB)':<12} {'Mem%':<8} {'DiskR(MB)':<12} {'DiskW(MB)':<12} {'Progress':<12}")
-        print("-" * 100)
-
-        for snapshot in self.snapshots:
+        for snapshot in self.iter_snapshots():
             time_str = snapshot.timestamp.strftime("%H:%M:%S")
             progress_str = f"{snapshot.conversion_progress*100:.0f}%" if snapshot.conversion_progress else "N/A"
 
-            print(f"{time_str:<20} "
-                  f"{snapshot.cpu_percent:<8.1f} "
-                  f"{snapshot.memory_used_gb:<12.2f} "
-                  f"{snapshot.memory_percent:<8.1f} "
-                  f"{snapshot.disk_io_read_mb:<12.1f} "
-                  f"{snapshot.disk_io_write_mb:<12.1f} "
-                  f"{progress_str:<12}")
+            lines.append(f"{time_str:<20} "
+                         f"{snapshot.cpu_percent:<8.1f} "
+                         f"{snapshot.memory_used_gb:<12.2f} "
+                         f"{snapshot.memory_percent:<8.1f} "
+                         f"{snapshot.disk_io_read_mb:<12.1f} "
+                         f"{snapshot.disk_io_write_mb:<12.1f} "
+                         f"{progress_str:<12}")
+
+        lines.append("=" * 100 + "\n")
 
-        print("=" * 100 + "\n")
+        # One write instead of a print() per row
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def save_to_file(self, filepath: str):
         """
@@ -300,29 +508,33 @@ class PerformanceMonitor:
         """
         import csv
 
-        with open(filepath, 'w', newline='', encoding='utf-8') as f:
+        rows = [
+            (
+                snapshot.timestamp.isoformat(),
+                snapshot.cpu_percent,
+                snapshot.memory_available_gb,
+                snapshot.memory_percent,
+                snapshot.memory_used_gb,
+                snapshot.disk_io_read_mb,
+                snapshot.disk_io_write_mb,
+                snapshot.conversion_progress,
+                snapshot.conversion_message
+            )
+            for snapshot in self.iter_snapshots()
+        ]
+
+        with open(filepath, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
             writer = csv.writer(f)
 
             # Header
             writer.writerow([
                 'Timestamp', 'CPU_Percent', 'Memory_Available_GB',
-                'Memory_Percent', 'Memory_Used_GB', 'Disk_Read_MB',
+                'Memory_Percent', 'Process_RSS_GB', 'Disk_Read_MB',
                 'Disk_Write_MB', 'Conversion_Progress', 'Conversion_Message'
             ])
 
             # Data
-            for snapshot in self.snapshots:
-                writer.writerow([
-                    snapshot.timestamp.isoformat(),
-                    snapshot.cpu_percent,
-                    snapshot.memory_available_gb,
-                    snapshot.memory_percent,
-                    snapshot.memory_used_gb,
-                    snapshot.disk_io_read_mb,
-                    snapshot.disk_io_write_mb,
-                    snapshot.conversion_progress,
-                    snapshot.conversion_message
-                ])
+            writer.writerows(rows)
 
         logger.info(f"Performance data saved to {filepath}")
 
@@ -349,6 +561,7 @@ def monitor_conversion(
     converter_func: Callable,
     *args,
     sample_interval: float = 1.0,
+    use_signal_timer: bool = False,
     **kwargs
 ):
     """
@@ -365,12 +578,16 @@ def monitor_conversion(
         converter_func: Function to run (should take no arguments)
         *args: Arguments to pass to converter_func
         sample_interval: Monitoring sample interval
+        use_signal_timer: Sample via SIGALRM instead of a background thread
         **kwargs: Keyword arguments to pass to converter_func
 
     Returns:
         Tuple of (result, PerformanceStats)
     """
-    monitor = PerformanceMonitor(sample_interval=sample_interval)
+    monitor = PerformanceMonitor(
+        sample_interval=sample_interval,
+        use_signal_timer=use_signal_timer
+    )
     monitor.start()
 
     try:
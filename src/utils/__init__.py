@@ -1,6 +1,6 @@
 """Utility modules."""
 
-from src.utils.logger import setup_logging, get_logger
+from src.utils.logger import setup_logging, shutdown_logging, get_logger
 from src.utils.config import load_config, save_config, Config
 
-__all__ = ["setup_logging", "get_logger", "load_config", "save_config", "Config"]
+__all__ = ["setup_logging", "shutdown_logging", "get_logger", "load_config", "save_config", "Config"]
@@ -4,16 +4,26 @@ Configuration management.
 Handles loading, saving, and accessing configuration settings.
 """
 
+import copy
 import yaml
 from pathlib import Path
-from dataclasses import dataclass, field, asdict
-from typing import List, Optional, Dict, Any
+from dataclasses import dataclass, field, fields
+from typing import List, Optional, Dict, Any, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml-backed loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
 
-@dataclass
+# Parsed configs keyed by (resolved path, mtime_ns); see load_config
+_CONFIG_CACHE: Dict[Tuple[str, int], "Config"] = {}
+
+
+@dataclass(slots=True)
 class ConversionConfig:
     """Configuration for PDF conversion settings."""
     output_format: str = "markdown"
@@ -21,7 +31,7 @@ class ConversionConfig:
     ocr_languages: List[str] = field(default_factory=lambda: ["en", "zh-CN", "zh-TW"])
 
 
-@dataclass
+@dataclass(slots=True)
 class MemoryConfig:
     """Configuration for memory management."""
     max_pages_in_memory: int = 5
@@ -30,7 +40,7 @@ class MemoryConfig:
     process_chunk_size: int = 3
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingConfig:
     """Configuration for processing settings."""
     max_workers: int = 4
@@ -38,7 +48,7 @@ class ProcessingConfig:
     timeout_seconds: int = 300
 
 
-@dataclass
+@dataclass(slots=True)
 class OutputConfig:
     """Configuration for output settings."""
     save_images: bool = True
@@ -48,7 +58,7 @@ class OutputConfig:
     preserve_code_blocks: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class LoggingConfig:
     """Configuration for logging settings."""
     level: str = "INFO"
@@ -56,7 +66,7 @@ class LoggingConfig:
     console: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """Main configuration container."""
 
@@ -87,14 +97,28 @@ class Config:
     def to_dict(self) -> Dict[str, Any]:
         """Convert Config to dictionary."""
         return {
-            "conversion": asdict(self.conversion),
-            "memory": asdict(self.memory),
-            "processing": asdict(self.processing),
-            "output": asdict(self.output),
-            "logging": asdict(self.logging),
+            "conversion": _section_to_dict(self.conversion),
+            "memory": _section_to_dict(self.memory),
+            "processing": _section_to_dict(self.processing),
+            "output": _section_to_dict(self.output),
+            "logging": _section_to_dict(self.logging),
         }
 
 
+def _section_to_dict(section: Any) -> Dict[str, Any]:
+    """
+    Flat equivalent of asdict() for a config section.
+
+    Sections only hold scalars and lists of scalars, so a single pass over
+    the fields (copying lists) avoids asdict()'s recursive deep copy.
+    """
+    result = {}
+    for f in fields(section):
+        value = getattr(section, f.name)
+        result[f.name] = list(value) if isinstance(value, list) else value
+    return result
+
+
 def load_config(path: Optional[str | Path] = None) -> Config:
     """
     Load configuration from file.
@@ -127,10 +151,22 @@ def load_config(path: Optional[str | Path] = None) -> Config:
         return Config()
 
     try:
+        resolved = str(config_path.resolve())
+        cache_key = (resolved, config_path.stat().st_mtime_ns)
+
+        cached = _CONFIG_CACHE.get(cache_key)
+        if cached is not None:
+            logger.debug(f"Using cached configuration for {config_path}")
+            return copy.deepcopy(cached)
+
         with open(config_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
+            data = yaml.load(f, Loader=_YamlLoader) or {}
 
         config = Config.from_dict(data)
+
+        _invalidate_cached_config(resolved)
+        _CONFIG_CACHE[cache_key] = copy.deepcopy(config)
+
         logger.info(f"Loaded configuration from {config_path}")
         return config
 
@@ -149,10 +185,16 @@ def save_config(config: Config, path: str | Path) -> None:
     """
     config_path = Path(path)
     config_path.parent.mkdir(parents=True, exist_ok=True)
+    _invalidate_cached_config(str(config_path.resolve()))
 
     try:
         with open(config_path, "w", encoding="utf-8") as f:
-            yaml.dump(config.to_dict(), f, default_flow_style=False, allow_unicode=True)
+            yaml.dump(
+                config.to_dict(), f,
+                Dumper=_YamlDumper,
+                default_flow_style=False,
+                allow_unicode=True
+            )
 
         logger.info(f"Saved configuration to {config_path}")
 
@@ -160,6 +202,12 @@ def save_config(config: Config, path: str | Path) -> None:
         logger.error(f"Failed to save config to {config_path}: {e}")
 
 
+def _invalidate_cached_config(resolved_path: str) -> None:
+    """Drop cached configs for a resolved config file path."""
+    for key in [key for key in _CONFIG_CACHE if key[0] == resolved_path]:
+        del _CONFIG_CACHE[key]
+
+
 def get_default_config() -> Config:
     """Get default configuration."""
     return Config()
@@ -4,17 +4,23 @@ Logging configuration and utilities.
 Provides structured logging for the PDF2MD application.
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
+import time
 from pathlib import Path
-from typing import Optional
-from datetime import datetime
+from typing import Dict, Optional
 
 
 # Log format
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 LOG_FORMAT_COLOR = "%(log_color)s%(asctime)s - %(name)s - %(levelname)s - %(message)s%(reset)s"
 
+# Background listener draining the file log queue (see setup_logging)
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
 # Color codes for terminal output
 class LogColors:
     """ANSI color codes for log levels."""
@@ -38,28 +44,34 @@ class ColoredFormatter(logging.Formatter):
     }
 
     def __init__(self, fmt: str, use_colors: bool = True):
-        """Initialize colored formatter."""
-        super().__init__(fmt)
-        self.use_colors = use_colors
+        """
+        Initialize colored formatter.
 
-    def format(self, record: logging.LogRecord) -> str:
-        """Format log record with colors."""
-        if self.use_colors:
-            color = self.COLORS.get(record.levelno, "")
-            record.log_color = color
-            record.reset = LogColors.RESET
-        else:
-            record.log_color = ""
-            record.reset = ""
+        Color tokens are substituted once here, producing one compiled
+        formatter per level, so format() does no per-record attribute writes.
+        """
+        plain_fmt = fmt.replace("%(log_color)s", "").replace("%(reset)s", "")
+        super().__init__(plain_fmt)
+        self.use_colors = use_colors
 
-        # Format the message
-        result = super().format(record)
+        self._level_formatters: Dict[int, logging.Formatter] = {}
+        if use_colors:
+            for levelno, color in self.COLORS.items():
+                if "%(log_color)s" in fmt:
+                    level_fmt = fmt.replace("%(log_color)s", color).replace("%(reset)s", LogColors.RESET)
+                else:
+                    level_fmt = f"{color}{plain_fmt}{LogColors.RESET}"
+                self._level_formatters[levelno] = logging.Formatter(level_fmt)
 
-        # Add reset if using colors
-        if self.use_colors:
-            result += LogColors.RESET
+        # Bound lookup, resolved once instead of per record
+        self._formatter_for = self._level_formatters.get
 
-        return result
+    def format(self, record: logging.LogRecord) -> str:
+        """Format log record with colors."""
+        formatter = self._formatter_for(record.levelno)
+        if formatter is None:
+            return super().format(record)
+        return formatter.format(record)
 
 
 def setup_logging(
@@ -88,6 +100,7 @@ def setup_logging(
     root_logger.setLevel(numeric_level)
 
     # Clear existing handlers
+    shutdown_logging()
     root_logger.handlers.clear()
 
     # Console handler
@@ -107,6 +120,8 @@ def setup_logging(
 
     # File handler
     if log_file:
+        global _queue_listener
+
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -116,11 +131,40 @@ def setup_logging(
         # No colors in file
         file_formatter = logging.Formatter(LOG_FORMAT)
         file_handler.setFormatter(file_formatter)
-        root_logger.addHandler(file_handler)
+
+        # Disk writes happen on a background listener thread; callers only
+        # enqueue the record
+        log_queue = queue.SimpleQueue()
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.setLevel(numeric_level)
+        root_logger.addHandler(queue_handler)
+
+        _queue_listener = logging.handlers.QueueListener(
+            log_queue, file_handler, respect_handler_level=True
+        )
+        _queue_listener.start()
 
     return root_logger
 
 
+def shutdown_logging() -> None:
+    """
+    Stop the background file log listener, flushing queued records.
+
+    Safe to call multiple times; registered with atexit.
+    """
+    global _queue_listener
+
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
+
+atexit.register(shutdown_logging)
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger with the specified name.
@@ -177,14 +221,13 @@ class ProgressLogger:
 
     def __enter__(self):
         """Enter context, log start message."""
-        self._start_time = datetime.now()
+        self._start_time = time.perf_counter()
         self.logger.log(self.level, self._format_message("started"))
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Exit context, log completion message."""
-        duration = datetime.now() - self._start_time
-        duration_str = self._format_duration(duration)
+        duration_str = self._format_duration(time.perf_counter() - self._start_time)
 
         if exc_type is None:
             self.logger.log(
@@ -211,10 +254,8 @@ class ProgressLogger:
         self.logger.log(self.level, " ".join(parts))
 
     @staticmethod
-    def _format_duration(delta) -> str:
-        """Format a timedelta as a readable string."""
-        seconds = delta.total_seconds()
-
+    def _format_duration(seconds: float) -> str:
+        """Format a duration in seconds as a readable string."""
         if seconds < 1:
             return f"{seconds*1000:.0f}ms"
         elif seconds < 60:
@@ -5,17 +5,56 @@ Detects CPU, GPU, and memory capabilities to optimize performance.
 """
 
 import os
+import bisect
+import csv
+import functools
+import importlib.metadata
+import importlib.util
+import io
+import json
 import platform
-import psutil
 import logging
-from typing import Optional, Dict, Any
-from dataclasses import dataclass
+import math
+import re
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Callable, Optional, Dict, Any, Tuple
+from dataclasses import dataclass, asdict, field, replace
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Persistent cache of CPU/GPU detection results (hardware does not change
+# between runs, but probing it spawns slow subprocesses)
+CACHE_FILE = Path.home() / ".cache" / "pdf2md" / "system_caps.json"
 
-@dataclass
+# "model name : ..." line in /proc/cpuinfo
+_CPUINFO_MODEL_RE = re.compile(rb"^model name\s*:\s*(.+)$", re.MULTILINE)
+
+# Resolved once; the OS cannot change while we run
+_PLATFORM = platform.system()
+
+_WINDOWS_CPU_MODEL_LOCK = threading.Lock()
+
+# AMD vendor/family markers in CPU and GPU model strings, matched in one pass.
+# Word boundaries keep e.g. "Camden" or AdapterRAM digits from matching.
+_AMD_MARKER_RE = re.compile(
+    r"\b(?:AI MAX|395|Radeon|Advanced Micro Devices|AMD)\b", re.IGNORECASE
+)
+_AMD_VENDOR_MARKERS = frozenset({"AMD", "RADEON", "ADVANCED MICRO DEVICES"})
+_AI_MAX_MARKERS = frozenset({"AI MAX", "395"})
+
+# Overall time limit for the concurrent command-line GPU probes (seconds).
+# Each probe may use all of it: a cold nvidia-smi without persistence mode
+# routinely needs more than a second.
+GPU_PROBE_BUDGET = 3.0
+
+
+@dataclass(slots=True, frozen=True)
 class CPUInfo:
     """CPU information."""
     model: str
@@ -25,7 +64,7 @@ class CPUInfo:
     architecture: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GPUInfo:
     """GPU information."""
     vendor: str  # 'nvidia', 'amd', 'intel', 'apple', 'none'
@@ -37,7 +76,7 @@ class GPUInfo:
     supports_mps: bool  # Apple Metal Performance Shaders
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MemoryInfo:
     """Memory information."""
     total_mb: float
@@ -45,7 +84,75 @@ class MemoryInfo:
     is_large_system: bool  # >64GB
 
 
-@dataclass
+def _amd_markers(text: str) -> frozenset:
+    """
+    Find the AMD markers present in a model string.
+
+    Args:
+        text: CPU or GPU model text
+
+    Returns:
+        Upper-cased markers found, e.g. {"AMD", "AI MAX", "395"}
+    """
+    return frozenset(m.upper() for m in _AMD_MARKER_RE.findall(text))
+
+
+def _compute_workers(physical_cores: int, total_mem_gb: float, has_gpu: bool) -> int:
+    """
+    Worker-count heuristic as a pure function of its inputs.
+
+    Args:
+        physical_cores: Physical CPU cores
+        total_mem_gb: Total system memory in GB
+        has_gpu: Whether any GPU was detected
+
+    Returns:
+        Recommended number of workers (1-16)
+    """
+    # Use physical cores as baseline
+    workers = physical_cores
+
+    # Memory-based adjustment for 32GB systems
+    if total_mem_gb >= 64:
+        # Large memory systems (>=64GB)
+        workers = int(workers * 1.5)
+    elif total_mem_gb >= 32:
+        # Medium memory systems (32-64GB) - optimal for AMD AI MAX+ 395
+        workers = int(workers * 1.0)  # Keep baseline
+    elif total_mem_gb >= 16:
+        # Small memory systems (16-32GB)
+        workers = int(workers * 0.75)
+    else:
+        # Very small memory (<16GB)
+        workers = int(workers * 0.5)
+
+    # GPU adjustment (only if we have enough CPU memory)
+    if has_gpu and total_mem_gb >= 32:
+        workers = int(workers * 1.0)  # Moderate increase for 32GB systems
+    elif has_gpu:
+        workers = int(workers * 1.2)  # Larger increase for bigger systems
+
+    # Cap at reasonable values
+    return max(1, min(workers, 16))  # Cap at 16 for 32GB systems
+
+
+# Batch size lookup per accelerator: ascending lower bounds and the batch
+# size for each bucket. GPU buckets are by memory_mb, CPU by physical cores.
+_BATCH_SIZE_TABLE: Dict[str, Tuple[Tuple[int, ...], Tuple[int, ...]]] = {
+    # 96GB VRAM (e.g. AMD AI MAX+ 395) gets super large batches
+    "cuda": ((0, 8000, 16000, 64000), (16, 32, 64, 128)),
+    "mps": ((0, 16000), (16, 32)),
+    "cpu": ((0, 8, 16), (4, 8, 16)),
+}
+
+
+def _lookup_batch_size(accelerator: str, value: float) -> int:
+    """Find the batch size bucket for a memory size or core count."""
+    bounds, sizes = _BATCH_SIZE_TABLE[accelerator]
+    return sizes[max(0, bisect.bisect_right(bounds, value) - 1)]
+
+
+@dataclass(slots=True, frozen=True)
 class SystemCapabilities:
     """Complete system capabilities."""
     cpu: CPUInfo
@@ -54,67 +161,65 @@ class SystemCapabilities:
     platform: str
     python_version: str
 
+    # Derived settings, computed once from the fields above in __post_init__
+    optimal_workers: int = field(init=False, compare=False)
+    optimal_batch_size: int = field(init=False, compare=False)
+    recommended_chunk_size: int = field(init=False, compare=False)
+
+    def __post_init__(self):
+        # Frozen, so derived fields are set through object.__setattr__
+        object.__setattr__(self, "optimal_workers", self._compute_optimal_workers())
+        object.__setattr__(self, "optimal_batch_size", self._compute_optimal_batch_size())
+        object.__setattr__(self, "recommended_chunk_size", self._compute_recommended_chunk_size())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert capabilities to a JSON-serializable dictionary."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SystemCapabilities":
+        """Create SystemCapabilities from dictionary."""
+        return cls(
+            cpu=CPUInfo(**data["cpu"]),
+            gpu=GPUInfo(**data["gpu"]),
+            memory=MemoryInfo(**data["memory"]),
+            platform=data["platform"],
+            python_version=data["python_version"]
+        )
+
     def get_optimal_workers(self) -> int:
         """Get optimal number of workers for this system."""
-        # Use physical cores as baseline
-        workers = self.cpu.cores_physical
-
-        # Memory-based adjustment for 32GB systems
-        total_mem_gb = self.memory.total_mb / 1024
-        if total_mem_gb >= 64:
-            # Large memory systems (>=64GB)
-            workers = int(workers * 1.5)
-        elif total_mem_gb >= 32:
-            # Medium memory systems (32-64GB) - optimal for AMD AI MAX+ 395
-            workers = int(workers * 1.0)  # Keep baseline
-        elif total_mem_gb >= 16:
-            # Small memory systems (16-32GB)
-            workers = int(workers * 0.75)
-        else:
-            # Very small memory (<16GB)
-            workers = int(workers * 0.5)
-
-        # GPU adjustment (only if we have enough CPU memory)
-        if self.gpu.vendor != 'none' and total_mem_gb >= 32:
-            workers = int(workers * 1.0)  # Moderate increase for 32GB systems
-        elif self.gpu.vendor != 'none':
-            workers = int(workers * 1.2)  # Larger increase for bigger systems
-
-        # Cap at reasonable values
-        return max(1, min(workers, 16))  # Cap at 16 for 32GB systems
+        return self.optimal_workers
 
     def get_optimal_batch_size(self) -> int:
         """Get optimal batch size for OCR/layout processing."""
-        # Default batch sizes
-        base_batch = 16
+        return self.optimal_batch_size
 
-        # Scale based on GPU memory
+    def get_recommended_chunk_size(self) -> int:
+        """Get recommended PDF page chunk size."""
+        return self.recommended_chunk_size
+
+    def _compute_optimal_workers(self) -> int:
+        """Compute optimal number of workers for this system."""
+        return _compute_workers(
+            self.cpu.cores_physical,
+            self.memory.total_mb / 1024,
+            self.gpu.vendor != 'none'
+        )
+
+    def _compute_optimal_batch_size(self) -> int:
+        """Compute optimal batch size for OCR/layout processing."""
         if self.gpu.supports_cuda or self.gpu.supports_rocm:
-            # GPU can handle larger batches
-            if self.gpu.memory_mb and self.gpu.memory_mb >= 64000:  # >=64GB (e.g., 96GB)
-                return 128  # Super large batches for 96GB VRAM
-            elif self.gpu.memory_mb and self.gpu.memory_mb >= 16000:  # >=16GB
-                return 64   # Large batches
-            elif self.gpu.memory_mb and self.gpu.memory_mb >= 8000:  # >=8GB
-                return 32   # Medium batches
-            else:
-                return 16   # Default GPU batch size
+            # GPU can handle larger batches; scale with GPU memory
+            return _lookup_batch_size("cuda", self.gpu.memory_mb or 0)
         elif self.gpu.vendor == 'apple' and self.gpu.supports_mps:
-            if self.gpu.memory_mb and self.gpu.memory_mb >= 16000:
-                return 32
-            else:
-                return 16
+            return _lookup_batch_size("mps", self.gpu.memory_mb or 0)
         else:
-            # CPU-only processing
-            if self.cpu.cores_physical >= 16:
-                return 16
-            elif self.cpu.cores_physical >= 8:
-                return 8
-            else:
-                return 4
+            # CPU-only processing; scale with physical cores
+            return _lookup_batch_size("cpu", self.cpu.cores_physical)
 
-    def get_recommended_chunk_size(self) -> int:
-        """Get recommended PDF page chunk size."""
+    def _compute_recommended_chunk_size(self) -> int:
+        """Compute recommended PDF page chunk size."""
         total_mem_gb = self.memory.total_mb / 1024
 
         # Chunk size based on available memory
@@ -132,6 +237,261 @@ class SystemCapabilities:
             return 3
 
 
+def _cgroup_cpu_quota() -> Optional[float]:
+    """
+    Read the cgroup CPU quota in cores (v2 cpu.max, then v1 cfs files).
+
+    Returns:
+        Allowed cores (may be fractional) or None when unlimited/unknown
+    """
+    try:
+        quota, period = Path("/sys/fs/cgroup/cpu.max").read_text().split()[:2]
+        if quota != "max":
+            return int(quota) / int(period)
+        return None
+    except (OSError, ValueError):
+        pass
+
+    try:
+        quota = int(Path("/sys/fs/cgroup/cpu/cpu.cfs_quota_us").read_text())
+        period = int(Path("/sys/fs/cgroup/cpu/cpu.cfs_period_us").read_text())
+        if quota > 0 and period > 0:
+            return quota / period
+    except (OSError, ValueError):
+        pass
+
+    return None
+
+
+def _available_cpu_count() -> Optional[int]:
+    """
+    Number of CPUs this process can use (affinity mask and cgroup quota).
+
+    Returns:
+        CPU count, or None if the platform exposes neither limit
+    """
+    available = None
+
+    if hasattr(os, "sched_getaffinity"):
+        try:
+            available = len(os.sched_getaffinity(0))
+        except OSError:
+            pass
+
+    if _PLATFORM == "Linux":
+        quota = _cgroup_cpu_quota()
+        if quota is not None:
+            quota_cores = max(1, math.ceil(quota))
+            available = quota_cores if available is None else min(available, quota_cores)
+
+    return available
+
+
+def _probe_noop() -> Optional[str]:
+    """Fallback probe for platforms without a CPU model source."""
+    return None
+
+
+def _probe_linux_cpu_model() -> Optional[str]:
+    """Read the CPU model name from /proc/cpuinfo."""
+    try:
+        # All cores share the model string, so the first block suffices
+        with open("/proc/cpuinfo", "rb") as f:
+            match = _CPUINFO_MODEL_RE.search(f.read(4096))
+        if match:
+            return match.group(1).decode("utf-8", errors="replace").strip()
+    except Exception:
+        pass
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def _read_windows_cpu_model() -> Optional[str]:
+    """Read the CPU brand string on Windows (registry, then wmic)."""
+    try:
+        import winreg
+        with winreg.OpenKey(
+            winreg.HKEY_LOCAL_MACHINE,
+            r"HARDWARE\DESCRIPTION\System\CentralProcessor\0"
+        ) as key:
+            name, _ = winreg.QueryValueEx(key, "ProcessorNameString")
+            if name and name.strip():
+                return name.strip()
+    except Exception as e:
+        logger.debug(f"Could not read CPU name from registry: {e}")
+
+    try:
+        result = subprocess.run(
+            ["wmic", "cpu", "get", "name"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            encoding="utf-8",
+            errors="replace",
+            timeout=5,
+            check=False
+        )
+        lines = result.stdout.strip().split('\n')
+        if len(lines) > 1:
+            return lines[1].strip()
+    except Exception:
+        pass
+
+    return None
+
+
+def _probe_windows_cpu_model() -> Optional[str]:
+    """
+    Windows CPU brand string, probed at most once per process.
+
+    Both CPU detection and the AMD AI MAX GPU check need it, and they run
+    concurrently; the lock keeps them from spawning wmic twice.
+    """
+    with _WINDOWS_CPU_MODEL_LOCK:
+        return _read_windows_cpu_model()
+
+
+def _probe_darwin_cpu_model() -> Optional[str]:
+    """Read the CPU brand string on macOS via sysctl."""
+    try:
+        result = subprocess.run(
+            ["sysctl", "-n", "machdep.cpu.brand_string"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            encoding="utf-8",
+            errors="replace",
+            timeout=5,
+            check=False
+        )
+        return result.stdout.strip() or None
+    except Exception:
+        return None
+
+
+# CPU model probe per platform.system() value
+_CPU_MODEL_PROBES: Dict[str, Callable[[], Optional[str]]] = {
+    "Linux": _probe_linux_cpu_model,
+    "Windows": _probe_windows_cpu_model,
+    "Darwin": _probe_darwin_cpu_model,
+}
+
+
+def _run_probe(name: str, args: list, timeout: float) -> Optional[str]:
+    """
+    Run one probe command.
+
+    Returns:
+        Decoded stdout, or None if the command is missing or fails
+
+    Raises:
+        subprocess.TimeoutExpired: If the command did not finish in time
+    """
+    try:
+        result = subprocess.run(
+            args,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            encoding="utf-8",
+            errors="replace",
+            timeout=timeout,
+            check=False
+        )
+    except FileNotFoundError as e:
+        logger.debug(f"GPU probe '{name}' unavailable: {e}")
+        return None
+
+    if result.returncode != 0:
+        logger.debug(f"GPU probe '{name}' exited with code {result.returncode}")
+        return None
+
+    return result.stdout
+
+
+_NVIDIA_SMI_FIELDS = "name,memory.total"
+
+
+def _probe_nvidia_smi(timeout: float) -> Optional[str]:
+    """
+    Query nvidia-smi for name, memory.total and compute_cap in one call.
+
+    Drivers older than R510 do not know the compute_cap field and reject
+    the whole query, so only then is it re-run without that field, within
+    what is left of the timeout.
+
+    Returns:
+        CSV rows of "name, memory.total[, compute_cap]", or None
+
+    Raises:
+        subprocess.TimeoutExpired: If the queries did not finish in time
+    """
+    deadline = time.monotonic() + timeout
+    output = _run_probe(
+        "nvidia",
+        ["nvidia-smi", f"--query-gpu={_NVIDIA_SMI_FIELDS},compute_cap",
+         "--format=csv,noheader,nounits"],
+        timeout,
+    )
+    if output is not None or shutil.which("nvidia-smi") is None:
+        return output
+
+    return _run_probe(
+        "nvidia",
+        ["nvidia-smi", f"--query-gpu={_NVIDIA_SMI_FIELDS}", "--format=csv,noheader,nounits"],
+        max(0.0, deadline - time.monotonic()),
+    )
+
+
+def _run_gpu_probes() -> Tuple[Dict[str, Optional[str]], bool]:
+    """
+    Run the command-line GPU probes for this platform concurrently.
+
+    The probes run side by side and each may take up to GPU_PROBE_BUDGET
+    seconds, so a slow tool cannot stall detection for longer than that.
+
+    Returns:
+        (outputs, complete): mapping of probe name ('nvidia', 'amd',
+        'apple') to its stdout, and whether every probe finished. Probes
+        that timed out are absent, so an incomplete result cannot tell
+        "no GPU" from "slow tool".
+    """
+    # Each probe takes its timeout in seconds
+    probes: Dict[str, Callable[[float], Optional[str]]] = {
+        "nvidia": _probe_nvidia_smi,
+    }
+    if _PLATFORM == "Windows":
+        probes["amd"] = functools.partial(
+            _run_probe, "amd", ["wmic", "path", "win32_VideoController", "get", "name,AdapterRAM"]
+        )
+    elif _PLATFORM == "Darwin":
+        probes["apple"] = functools.partial(
+            _run_probe, "apple", ["sysctl", "-n", "machdep.cpu.brand_string"]
+        )
+
+    executor = ThreadPoolExecutor(max_workers=len(probes), thread_name_prefix="gpu-probe")
+    futures = {
+        name: executor.submit(probe, GPU_PROBE_BUDGET)
+        for name, probe in probes.items()
+    }
+    # Don't block on stragglers past the budget
+    done, not_done = wait(futures.values(), timeout=GPU_PROBE_BUDGET)
+    executor.shutdown(wait=False)
+
+    complete = not not_done
+    if not_done:
+        logger.debug(f"GPU probes exceeded {GPU_PROBE_BUDGET}s budget")
+
+    outputs: Dict[str, Optional[str]] = {}
+    for name, future in futures.items():
+        if future in done:
+            try:
+                outputs[name] = future.result()
+            except subprocess.TimeoutExpired:
+                logger.debug(f"GPU probe '{name}' timed out after {GPU_PROBE_BUDGET}s")
+                complete = False
+            except Exception as e:
+                logger.debug(f"GPU probe '{name}' failed: {e}")
+    return outputs, complete
+
+
 class SystemDetector:
     """
     Detects system hardware and capabilities.
@@ -143,38 +503,155 @@ class SystemDetector:
     - Platform specifics
     """
 
-    def __init__(self):
+    def __init__(self, use_cache: bool = True, cache_file: Optional[str | Path] = None):
+        """
+        Initialize system detector.
+
+        Args:
+            use_cache: Whether to reuse CPU/GPU results persisted by earlier runs
+            cache_file: Path of the cache file (default: CACHE_FILE)
+        """
+        self.use_cache = use_cache
+        self.cache_file = Path(cache_file) if cache_file else CACHE_FILE
+
         self._cpu_info: Optional[CPUInfo] = None
         self._gpu_info: Optional[GPUInfo] = None
         self._memory_info: Optional[MemoryInfo] = None
         self._capabilities: Optional[SystemCapabilities] = None
+        # Serializes detect() so concurrent cold callers probe and write once
+        self._detect_lock = threading.Lock()
+        # Set by _detect_gpu when a probe timed out; such results are not cached
+        self._gpu_probe_incomplete = False
+        # (model, memory_mb, is_rocm) from PyTorch; False once known unavailable
+        self._torch_gpu_cache: Optional[Tuple[str, int, bool] | bool] = None
+
+    @staticmethod
+    def _cache_key() -> list:
+        """
+        Identify the machine and environment the cached results belong to.
+
+        GPU detection can fall back to PyTorch, whose result depends on the
+        installed build (CPU, CUDA or ROCm), so its version is part of the key.
+        So is the presence of the NVIDIA tools: a cached "no GPU" result must
+        not outlive a later driver or pynvml install.
+        """
+        try:
+            torch_version = importlib.metadata.version("torch")
+        except importlib.metadata.PackageNotFoundError:
+            torch_version = None
+        return [
+            platform.node(),
+            platform.release(),
+            torch_version,
+            shutil.which("nvidia-smi") is not None,
+            importlib.util.find_spec("pynvml") is not None,
+        ]
+
+    def _load_cached_hardware(self) -> bool:
+        """
+        Load CPU/GPU info from the cache file.
 
-    def detect(self) -> SystemCapabilities:
+        Returns:
+            True if a cache entry for this machine was loaded
+        """
+        try:
+            data = json.loads(self.cache_file.read_text(encoding="utf-8"))
+            if data.get("key") != self._cache_key():
+                return False
+
+            self._cpu_info = CPUInfo(**data["cpu"])
+            self._gpu_info = GPUInfo(**data["gpu"])
+            logger.debug(f"Loaded cached system detection from {self.cache_file}")
+            return True
+
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable system cache {self.cache_file}: {e}")
+            return False
+
+    def _save_cached_hardware(self) -> None:
+        """Persist CPU/GPU info for later runs."""
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            data = {
+                "key": self._cache_key(),
+                "cpu": asdict(self._cpu_info),
+                "gpu": asdict(self._gpu_info),
+            }
+            # Write to a temp file and rename so readers never see a partial file
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.cache_file.parent, prefix=self.cache_file.name, suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f, indent=2)
+                os.replace(tmp_path, self.cache_file)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except Exception as e:
+            logger.debug(f"Could not write system cache {self.cache_file}: {e}")
+
+    def detect(self, refresh: bool = False) -> SystemCapabilities:
         """
         Detect all system capabilities.
 
+        CPU and GPU results are reused from the cache file when available;
+        memory is always detected fresh since availability changes.
+
+        Args:
+            refresh: Re-probe hardware and rewrite the cache (e.g. after
+                installing GPU drivers or PyTorch)
+
         Returns:
             SystemCapabilities with complete system information
         """
-        if self._capabilities is None:
-            self._cpu_info = self._detect_cpu()
-            self._gpu_info = self._detect_gpu()
-            self._memory_info = self._detect_memory()
-
-            self._capabilities = SystemCapabilities(
-                cpu=self._cpu_info,
-                gpu=self._gpu_info,
-                memory=self._memory_info,
-                platform=platform.system(),
-                python_version=platform.python_version()
-            )
+        with self._detect_lock:
+            if refresh:
+                self._capabilities = None
+
+            if self._capabilities is None:
+                use_cached = self.use_cache and not refresh
+                if use_cached and self._load_cached_hardware():
+                    self._memory_info = self._detect_memory()
+                else:
+                    # Probes are dominated by subprocess/file I/O, so overlap them
+                    with ThreadPoolExecutor(max_workers=3, thread_name_prefix="detect") as executor:
+                        cpu_future = executor.submit(self._detect_cpu)
+                        gpu_future = executor.submit(self._detect_gpu)
+                        memory_future = executor.submit(self._detect_memory)
+
+                        self._cpu_info = cpu_future.result()
+                        self._gpu_info = gpu_future.result()
+                        self._memory_info = memory_future.result()
+
+                    # A timed-out probe looks like "no GPU"; don't persist that
+                    if self.use_cache and not self._gpu_probe_incomplete:
+                        self._save_cached_hardware()
+                    elif self._gpu_probe_incomplete:
+                        logger.debug("GPU probes incomplete; not caching hardware detection")
+
+                # Affinity and cgroup quotas can differ per run, so apply them
+                # after the (possibly cached) host core counts
+                self._cpu_info = self._limit_to_available_cpus(self._cpu_info)
+
+                self._capabilities = SystemCapabilities(
+                    cpu=self._cpu_info,
+                    gpu=self._gpu_info,
+                    memory=self._memory_info,
+                    platform=_PLATFORM,
+                    python_version=platform.python_version()
+                )
 
-            logger.info(f"Detected system: {self._capabilities}")
+                logger.info(f"Detected system: {self._capabilities}")
 
-        return self._capabilities
+            return self._capabilities
 
     def _detect_cpu(self) -> CPUInfo:
         """Detect CPU information."""
+        import psutil  # Imported lazily; only needed when detection runs
+
         # Get CPU info
         physical_cores = psutil.cpu_count(logical=False) or 1
         total_cores = psutil.cpu_count(logical=True) or 1
@@ -189,50 +666,14 @@ class SystemDetector:
             logger.debug(f"Could not get CPU frequency: {e}")
 
         # Try to detect CPU model
-        model = "Unknown CPU"
-        if platform.system() == "Linux":
-            try:
-                with open("/proc/cpuinfo", "r") as f:
-                    for line in f:
-                        if "model name" in line:
-                            model = line.split(":", 1)[1].strip()
-                            break
-            except Exception:
-                pass
-        elif platform.system() == "Windows":
-            try:
-                import subprocess
-                result = subprocess.check_output(
-                    "wmic cpu get name",
-                    shell=True,
-                    text=True,
-                    stderr=subprocess.DEVNULL
-                )
-                lines = result.strip().split('\n')
-                if len(lines) > 1:
-                    model = lines[1].strip()
-            except Exception:
-                pass
-        elif platform.system() == "Darwin":
-            try:
-                import subprocess
-                result = subprocess.check_output(
-                    ["sysctl", "-n", "machdep.cpu.brand_string"],
-                    text=True
-                )
-                model = result.strip()
-            except Exception:
-                pass
+        probe = _CPU_MODEL_PROBES.get(_PLATFORM, _probe_noop)
+        model = probe() or "Unknown CPU"
 
         # Detect AMD CPU specifically
         cpu_arch = platform.machine() or "unknown"
-        if "AMD" in model or "amd" in model:
-            # AMD CPU detected
-            if "395" in model or "AI MAX" in model:
-                model = f"AMD AI MAX+ 395 (Detected)"
-            elif "Ryzen" in model:
-                # Keep original Ryzen name
-                pass
+        markers = _amd_markers(model)
+        if markers & _AMD_VENDOR_MARKERS and markers & _AI_MAX_MARKERS:
+            model = "AMD AI MAX+ 395 (Detected)"
 
         return CPUInfo(
             model=model,
@@ -252,123 +693,91 @@ class SystemDetector:
         supports_rocm = False
         supports_mps = False
 
-        # Check for NVIDIA GPU
-        try:
-            import subprocess
-            result = subprocess.run(
-                ["nvidia-smi", "--query-gpu=name,memory.total", "--format=csv,noheader"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')
-                if lines and lines[0]:
-                    parts = lines[0].split(',')
-                    if len(parts) >= 2:
-                        model = parts[0].strip()
-                        mem_str = parts[1].strip()
-                        # Parse memory like "8192 MiB"
-                        mem_mb = int(mem_str.split()[0])
-                        memory_mb = mem_mb
-                        vendor = "nvidia"
-                        supports_cuda = True
-                        logger.info(f"Detected NVIDIA GPU: {model} with {memory_mb}MB")
-        except (FileNotFoundError, subprocess.TimeoutExpired, Exception) as e:
-            logger.debug(f"No NVIDIA GPU detected: {e}")
-
-        # Check for AMD GPU
+        # Check for NVIDIA GPU (NVML library first, nvidia-smi as fallback)
+        nvml_gpu = self._query_nvml()
+        if nvml_gpu is not None:
+            model, memory_mb, compute_capability = nvml_gpu
+            vendor = "nvidia"
+            supports_cuda = True
+            logger.info(f"Detected NVIDIA GPU: {model} with {memory_mb}MB")
+
+        # Run the remaining command-line probes concurrently under one budget
+        probe_output: Dict[str, Optional[str]] = {}
+        self._gpu_probe_incomplete = False
         if vendor == "none":
-            try:
-                # Try AMD GPU query on Windows
-                if platform.system() == "Windows":
-                    try:
-                        import subprocess
-                        result = subprocess.run(
-                            ["wmic", "path", "win32_VideoController", "get", "name,AdapterRAM"],
-                            capture_output=True,
-                            text=True,
-                            timeout=5,
-                            stderr=subprocess.DEVNULL
-                        )
-                        if result.returncode == 0:
-                            output = result.stdout
-                            if "AMD" in output or "Radeon" in output or "Advanced Micro Devices" in output:
-                                # Parse AMD GPU info
-                                lines = [line.strip() for line in output.split('\n') if line.strip()]
-                                if len(lines) > 1:
-                                    model = lines[1].split()[0] if lines[1] else "AMD GPU"
-                                    vendor = "amd"
-                                    supports_rocm = True
-                                    logger.info(f"Detected AMD GPU: {model}")
-                    except Exception as e:
-                        logger.debug(f"AMD GPU detection failed: {e}")
-            except Exception as e:
-                logger.debug(f"AMD GPU detection error: {e}")
+            probe_output, probes_complete = _run_gpu_probes()
+            self._gpu_probe_incomplete = not probes_complete
 
-        # Additional AMD GPU detection via PyTorch
-        if vendor == "none":
+        nvidia_output = probe_output.get("nvidia")
+        if vendor == "none" and nvidia_output:
             try:
-                import torch
-                if torch.cuda.is_available():
-                    # Check if it's ROCm
-                    if hasattr(torch.version, 'cuda') and 'rocm' in torch.version.cuda.lower():
-                        vendor = "amd"
-                        model = "AMD GPU (via ROCm/PyTorch)"
-                        supports_rocm = True
-                        memory_mb = torch.cuda.get_device_properties(0).total_memory / (1024 * 1024)
-                        logger.info(f"Detected AMD GPU via PyTorch ROCm: {model} with {memory_mb:.0f}MB")
-                    else:
-                        # CUDA (likely NVIDIA)
-                        vendor = "nvidia"
-                        supports_cuda = True
-                        memory_mb = torch.cuda.get_device_properties(0).total_memory / (1024 * 1024)
-                        model = torch.cuda.get_device_name(0)
-                        logger.info(f"Detected CUDA GPU: {model} with {memory_mb:.0f}MB")
-            except ImportError:
-                logger.debug("PyTorch not available for GPU detection")
+                # One row per GPU: name, memory.total (MiB)[, compute_cap]
+                row = next(csv.reader(io.StringIO(nvidia_output), skipinitialspace=True), None)
+                if row and len(row) >= 2:
+                    model = row[0].strip()
+                    memory_mb = int(row[1])
+                    vendor = "nvidia"
+                    supports_cuda = True
+                    if len(row) >= 3 and row[2].strip() not in ("", "[N/A]"):
+                        compute_capability = row[2].strip()
+                    logger.info(f"Detected NVIDIA GPU: {model} with {memory_mb}MB")
             except Exception as e:
-                logger.debug(f"PyTorch GPU detection failed: {e}")
+                logger.debug(f"No NVIDIA GPU detected: {e}")
+
+        # Check for AMD GPU (Windows video controller query)
+        amd_output = probe_output.get("amd")
+        if vendor == "none" and amd_output:
+            if _amd_markers(amd_output) & _AMD_VENDOR_MARKERS:
+                # Parse AMD GPU info
+                lines = [line.strip() for line in amd_output.split('\n') if line.strip()]
+                if len(lines) > 1:
+                    model = lines[1].split()[0] if lines[1] else "AMD GPU"
+                    vendor = "amd"
+                    supports_rocm = True
+                    logger.info(f"Detected AMD GPU: {model}")
 
         # Check for Apple Silicon (M1/M2/M3)
-        if vendor == "none" and platform.system() == "Darwin":
-            try:
-                import subprocess
-                result = subprocess.run(
-                    ["sysctl", "-n", "machdep.cpu.brand_string"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                if "Apple" in result.stdout:
-                    vendor = "apple"
-                    model = result.stdout.strip()
-                    supports_mps = True
-                    logger.info(f"Detected Apple Silicon: {model}")
-            except Exception:
-                pass
+        apple_output = probe_output.get("apple")
+        if vendor == "none" and apple_output and "Apple" in apple_output:
+            vendor = "apple"
+            model = apple_output.strip()
+            supports_mps = True
+            logger.info(f"Detected Apple Silicon: {model}")
+
+        # Additional AMD GPU detection via PyTorch. Importing torch costs
+        # seconds, so only do it when every cheaper probe came up empty and
+        # torch is actually installed.
+        if vendor == "none" and importlib.util.find_spec("torch") is None:
+            logger.debug("PyTorch not available for GPU detection")
+        elif vendor == "none":
+            torch_gpu = self._query_torch()
+            if torch_gpu is not None:
+                model, memory_mb, is_rocm = torch_gpu
+                if is_rocm:
+                    vendor = "amd"
+                    model = "AMD GPU (via ROCm/PyTorch)"
+                    supports_rocm = True
+                    logger.info(f"Detected AMD GPU via PyTorch ROCm: {model} with {memory_mb}MB")
+                else:
+                    # CUDA (likely NVIDIA)
+                    vendor = "nvidia"
+                    supports_cuda = True
+                    logger.info(f"Detected CUDA GPU: {model} with {memory_mb}MB")
 
         # Special detection for AMD AI MAX+ 395
         if vendor == "amd" or vendor == "none":
             # Check for AMD AI MAX specifically
-            if platform.system() == "Windows":
-                try:
-                    import subprocess
-                    result = subprocess.check_output(
-                        "wmic cpu get name",
-                        shell=True,
-                        text=True,
-                        stderr=subprocess.DEVNULL
-                    )
-                    if "395" in result or "AI MAX" in result:
-                        vendor = "amd"
-                        model = "AMD AI MAX+ 395 / 8060S"
-                        supports_rocm = True
-                        # Assume large GPU memory for this platform
-                        memory_mb = 96000  # Up to 96GB
-                        logger.info(f"Detected AMD AI MAX+ 395 platform with {memory_mb}MB GPU memory")
-                except Exception:
-                    pass
+            if _PLATFORM == "Windows":
+                # Shares the memoized CPU name probe with _detect_cpu
+                cpu_name = _probe_windows_cpu_model() or ""
+                markers = _amd_markers(cpu_name)
+                if markers & _AMD_VENDOR_MARKERS and markers & _AI_MAX_MARKERS:
+                    vendor = "amd"
+                    model = "AMD AI MAX+ 395 / 8060S"
+                    supports_rocm = True
+                    # Assume large GPU memory for this platform
+                    memory_mb = 96000  # Up to 96GB
+                    logger.info(f"Detected AMD AI MAX+ 395 platform with {memory_mb}MB GPU memory")
 
         return GPUInfo(
             vendor=vendor,
@@ -380,8 +789,85 @@ class SystemDetector:
             supports_mps=supports_mps
         )
 
+    @staticmethod
+    def _limit_to_available_cpus(cpu: CPUInfo) -> CPUInfo:
+        """Cap core counts to the CPUs this process may actually use."""
+        available = _available_cpu_count()
+        if available is None or available >= cpu.cores_total:
+            return cpu
+
+        logger.info(f"CPU usage limited to {available} of {cpu.cores_total} logical cores "
+                    f"(affinity/cgroup quota)")
+        return replace(
+            cpu,
+            cores_physical=max(1, min(cpu.cores_physical, available)),
+            cores_total=available
+        )
+
+    @staticmethod
+    def _query_nvml() -> Optional[tuple]:
+        """
+        Query the first NVIDIA GPU through NVML (pynvml), without a subprocess.
+
+        Returns:
+            (model, memory_mb, compute_capability) or None if NVML is unavailable
+        """
+        try:
+            import pynvml
+        except ImportError:
+            return None
+
+        try:
+            pynvml.nvmlInit()
+            try:
+                if pynvml.nvmlDeviceGetCount() == 0:
+                    return None
+                handle = pynvml.nvmlDeviceGetHandleByIndex(0)
+                name = pynvml.nvmlDeviceGetName(handle)
+                if isinstance(name, bytes):
+                    name = name.decode("utf-8", errors="replace")
+                memory_mb = pynvml.nvmlDeviceGetMemoryInfo(handle).total // (1024 * 1024)
+                try:
+                    major, minor = pynvml.nvmlDeviceGetCudaComputeCapability(handle)
+                    compute_capability = f"{major}.{minor}"
+                except Exception as e:
+                    # Missing from old pynvml/driver versions; the GPU is still usable
+                    logger.debug(f"NVML compute capability unavailable: {e}")
+                    compute_capability = None
+                return name, memory_mb, compute_capability
+            finally:
+                pynvml.nvmlShutdown()
+        except Exception as e:
+            logger.debug(f"NVML query failed: {e}")
+            return None
+
+    def _query_torch(self) -> Optional[Tuple[str, int, bool]]:
+        """
+        Query the first GPU visible to PyTorch, once per detector.
+
+        Returns:
+            (model, memory_mb, is_rocm) or None if PyTorch sees no GPU
+        """
+        if self._torch_gpu_cache is None:
+            self._torch_gpu_cache = False
+            try:
+                import torch
+                if torch.cuda.is_available():
+                    total = torch.cuda.get_device_properties(0).total_memory
+                    # ROCm builds report a HIP version and no CUDA version
+                    is_rocm = getattr(torch.version, "hip", None) is not None
+                    self._torch_gpu_cache = (torch.cuda.get_device_name(0), total >> 20, is_rocm)
+            except ImportError:
+                logger.debug("PyTorch not available for GPU detection")
+            except Exception as e:
+                logger.debug(f"PyTorch GPU detection failed: {e}")
+
+        return self._torch_gpu_cache or None
+
     def _detect_memory(self) -> MemoryInfo:
         """Detect system memory information."""
+        import psutil  # Imported lazily; only needed when detection runs
+
         mem = psutil.virtual_memory()
 
         total_mb = mem.total / (1024 * 1024)
@@ -412,6 +898,10 @@ class SystemDetector:
 
     def print_system_info(self):
         """Print detailed system information to logs."""
+        # Skip detection and ~30 formatted lines when INFO would be dropped
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
         caps = self.detect()
 
         logger.info("=" * 60)
@@ -448,13 +938,16 @@ class SystemDetector:
 
 # Global instance
 _detector = None
+_detector_lock = threading.Lock()
 
 
 def get_system_detector() -> SystemDetector:
     """Get the global system detector instance."""
     global _detector
     if _detector is None:
-        _detector = SystemDetector()
+        with _detector_lock:
+            if _detector is None:
+                _detector = SystemDetector()
     return _detector
 
 
@@ -55,10 +55,8 @@ def test_progress_bar():
                 total=10
             )
 
-            import time
-            for i in range(10):
-                time.sleep(0.1)
-                progress.update(task, advance=1)
+            # 一次性完成并立即渲染，无需逐步sleep
+            progress.update(task, completed=10, refresh=True)
 
         console.print("[green]OK 进度条测试通过[/green]\n")
         return True
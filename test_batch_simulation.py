@@ -4,11 +4,11 @@
 测试进度条在实际转换中的表现
 """
 
+import asyncio
+import queue
 import sys
 import time
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from threading import Lock
 
 # Ensure UTF-8 encoding
 if sys.platform == 'win32':
@@ -26,15 +26,97 @@ from rich.progress import (
     TaskProgressColumn,
 )
 
+from test_progress_real import background_refresh
+
 console = Console()
 
 
-def simulate_conversion(task_name: str, duration: float):
+class ThrottledProgress:
+    """
+    节流的进度更新：累积 advance，最多每 interval 秒刷新一次进度条
+
+    消息先放入有界队列，在刷新时统一输出，避免每个任务都抢占 Rich 渲染锁。
+    只应在驱动批处理的事件循环线程中调用，因此无需加锁。
+    """
+
+    def __init__(self, progress: Progress, task_id, interval: float = 0.05, max_messages: int = 100):
+        self._progress = progress
+        self._task_id = task_id
+        self._interval = interval
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        self._messages = queue.Queue(maxsize=max_messages)
+
+    def advance(self, amount: int = 1, message: str = None):
+        """累积进度，到达刷新间隔时才真正更新进度条"""
+        if message:
+            try:
+                self._messages.put_nowait(message)
+            except queue.Full:
+                pass  # 丢弃过多的消息，进度本身不受影响
+
+        self._pending += amount
+        if time.monotonic() - self._last_flush >= self._interval:
+            self.flush()
+
+    def flush(self):
+        """立即刷新累积的进度和消息"""
+        if self._pending:
+            self._progress.update(self._task_id, advance=self._pending)
+            self._pending = 0
+        self._last_flush = time.monotonic()
+
+        while True:
+            try:
+                message = self._messages.get_nowait()
+            except queue.Empty:
+                break
+            self._progress.console.print(f"[dim]{message}[/dim]")
+
+
+async def simulate_conversion(task_name: str, duration: float):
     """模拟一个 PDF 转换任务"""
-    time.sleep(duration)
+    await asyncio.sleep(duration)
     return {"name": task_name, "success": True, "pages": 10}
 
 
+async def run_batch(tasks, max_concurrent: int, progress_callback=None):
+    """
+    在单个事件循环线程中并发运行模拟转换，按完成顺序回调进度
+
+    回调与转换运行在同一线程，计数和结果收集都不需要加锁
+    """
+    semaphore = asyncio.Semaphore(max_concurrent)
+    total_tasks = len(tasks)
+
+    async def run_one(task_name: str):
+        async with semaphore:
+            try:
+                return task_name, await simulate_conversion(task_name, 1.5), None
+            except Exception as e:
+                return task_name, None, e
+
+    results = []
+    completed = 0
+    pending = [asyncio.create_task(run_one(task_name)) for task_name in tasks]
+
+    for next_done in asyncio.as_completed(pending):
+        task_name, result, error = await next_done
+        completed += 1
+
+        if error is None:
+            results.append(result)
+            if progress_callback:
+                message = f"Converted {task_name}"
+                if result["success"]:
+                    message += f" ({result['pages']} pages)"
+                progress_callback(completed, total_tasks, message)
+        elif progress_callback:
+            progress_callback(completed, total_tasks, f"Error: {task_name} - {error}")
+
+    return results
+
+
 def test_real_batch_processing():
     """测试真实的批处理场景"""
     console.print("\n[bold cyan]真实批处理场景测试[/bold cyan]\n")
@@ -49,9 +131,6 @@ def test_real_batch_processing():
     ]
 
     total_tasks = len(tasks)
-    results = []
-    lock = Lock()
-    completed = 0
 
     console.print(f"[cyan]准备处理 {total_tasks} 个任务...[/cyan]\n")
 
@@ -61,8 +140,7 @@ def test_real_batch_processing():
         BarColumn(),
         TaskProgressColumn(),
         TextColumn("[bold cyan]{task.completed}[/bold cyan]/{task.total}"),
-        console=console,
-        refresh_per_second=10  # 控制刷新率
+        console=console
     ) as progress:
 
         task = progress.add_task(
@@ -70,48 +148,19 @@ def test_real_batch_processing():
             total=total_tasks
         )
 
-        completed_count = [0]
+        throttled = ThrottledProgress(progress, task)
 
         def progress_callback(current: int, total: int, message: str):
-            """进度回调函数"""
-            new_completed = current - completed_count[0]
-            if new_completed > 0:
-                progress.update(task, advance=new_completed)
-                completed_count[0] = current
-                console.print(f"[dim]进度更新: {current}/{total} - {message}[/dim]")
-
-        # 使用线程池模拟批处理
-        with ThreadPoolExecutor(max_workers=2) as executor:
-            # 提交所有任务
-            futures = {executor.submit(simulate_conversion, task_name, 1.5): task_name
-                      for task_name in tasks}
-
-            console.print("[yellow]开始并行处理 (2个worker)...[/yellow]\n")
-
-            # 处理完成的任务
-            for future in as_completed(futures):
-                task_name = futures[future]
-                try:
-                    result = future.result()
-                    with lock:
-                        results.append(result)
-                        completed += 1
-
-                    console.print(f"[green]✓ 完成: {task_name}[/green]")
-
-                    if progress_callback:
-                        message = f"Converted {task_name}"
-                        if result["success"]:
-                            message += f" ({result['pages']} pages)"
-                        progress_callback(completed, total_tasks, message)
-
-                except Exception as e:
-                    console.print(f"[red]✗ 失败: {task_name} - {e}[/red]")
-                    with lock:
-                        completed += 1
-
-                    if progress_callback:
-                        progress_callback(completed, total_tasks, f"Error: {task_name}")
+            """进度回调函数（节流，20Hz）；每次调用对应一个完成的任务，无共享读改写"""
+            throttled.advance(1, f"进度更新: {current}/{total} - {message}")
+
+        console.print("[yellow]开始并行处理 (2个并发)...[/yellow]\n")
+
+        # 在事件循环中并发模拟批处理
+        results = asyncio.run(run_batch(tasks, 2, progress_callback))
+
+        # 输出剩余的累积进度
+        throttled.flush()
 
     # 显示汇总
     console.print("\n")
@@ -119,7 +168,7 @@ def test_real_batch_processing():
     console.print("║                        处理结果                                 ║")
     console.print("╚══════════════════════════════════════════════════════════════╝\n")
 
-    successful = len([r for r in results if r["success"]])
+    successful = sum(1 for r in results if r["success"])
     console.print(f"总计: {len(results)}")
     console.print(f"[green]成功: {successful}[/green]")
     console.print(f"[red]失败: {len(results) - successful}[/red]\n")
@@ -140,15 +189,16 @@ def test_slow_progress():
         TaskProgressColumn(),
         TextColumn("[bold cyan]{task.completed}[/bold cyan]/{task.total}"),
         console=console,
-        refresh_per_second=4  # 降低刷新率以便观察
-    ) as progress:
+        auto_refresh=False,  # 由后台线程统一刷新
+        transient=False,
+        expand=False
+    ) as progress, background_refresh(progress):
 
         task = progress.add_task("Processing...", total=total)
 
-        for i in range(total):
+        for _ in range(total):
             time.sleep(0.8)  # 每次等待0.8秒
             progress.update(task, advance=1)
-            console.print(f"[cyan]进度: {i+1}/{total}[/cyan]")
 
     console.print("\n[green]测试完成[/green]\n")
     return True
@@ -9,6 +9,10 @@ PDF2MD 完整系统测试脚本
 
 import sys
 import os
+import functools
+import importlib
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import traceback
 
@@ -17,21 +21,25 @@ sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 
 class TestResult:
-    """测试结果"""
-    def __init__(self):
+    """测试结果（输出先缓存，由 main 按测试顺序打印，并行运行时不会互相穿插）"""
+    def __init__(self, title):
         self.passed = 0
         self.failed = 0
         self.errors = []
+        self.lines = [title]
 
     def add_pass(self, test_name):
         self.passed += 1
-        print(f"  [PASS] {test_name}")
+        self.lines.append(f"  [PASS] {test_name}")
 
     def add_fail(self, test_name, error):
         self.failed += 1
         self.errors.append((test_name, error))
-        print(f"  [FAIL] {test_name}")
-        print(f"    Error: {error}")
+        self.lines.append(f"  [FAIL] {test_name}")
+        self.lines.append(f"    Error: {error}")
+
+    def print_output(self):
+        print("\n".join(self.lines))
 
     def print_summary(self):
         total = self.passed + self.failed
@@ -45,61 +53,114 @@ class TestResult:
         return self.failed == 0
 
 
-def test_imports():
-    """测试1：所有模块可以正常导入"""
-    print("\n测试1: 模块导入...")
+# 导入测试: (测试名, 模块, 需要的名称)
+IMPORT_SPECS = [
+    ("psutil导入", "psutil", ()),
+    ("cpu_optimizer导入", "core.cpu_optimizer", ("AMDCPUOptimizer", "AdvancedMemoryManager")),
+    ("performance_monitor导入", "core.performance_monitor", ("PerformanceMonitor",)),
+    ("converter导入", "core.converter", ("DoclingConverter", "ConversionConfig")),
+    ("config导入", "utils.config", ("load_config", "Config")),
+    ("rich导入", "rich.console", ("Console",)),
+]
+
+
+def _import_specs(specs):
+    """依次导入模块并检查名称，返回 (测试名, 错误或None) 列表"""
+    errors = []
+    for test_name, module_name, names in specs:
+        try:
+            module = importlib.import_module(module_name)
+            for name in names:
+                if not hasattr(module, name):
+                    raise ImportError(f"cannot import name '{name}' from '{module_name}'")
+        except ImportError as e:
+            errors.append((test_name, e))
+        except Exception as e:
+            # 例如依赖只装了一半时的 AttributeError：只记为该项失败
+            errors.append((test_name, f"{type(e).__name__}: {e}"))
+        else:
+            errors.append((test_name, None))
+    return errors
 
-    result = TestResult()
 
-    try:
-        import psutil
-        result.add_pass("psutil导入")
-    except ImportError as e:
-        result.add_fail("psutil导入", e)
+@functools.lru_cache(maxsize=1)
+def _get_optimizer():
+    """系统检测结果在一次测试运行中不变，只初始化一次优化器"""
+    from core.cpu_optimizer import AMDCPUOptimizer
+    return AMDCPUOptimizer()
 
-    try:
-        from core.cpu_optimizer import AMDCPUOptimizer, AdvancedMemoryManager
-        result.add_pass("cpu_optimizer导入")
-    except ImportError as e:
-        result.add_fail("cpu_optimizer导入", e)
 
-    try:
-        from core.performance_monitor import PerformanceMonitor
-        result.add_pass("performance_monitor导入")
-    except ImportError as e:
-        result.add_fail("performance_monitor导入", e)
+@functools.lru_cache(maxsize=None)
+def _get_optimal_config(enable_gpu=False):
+    """缓存最优配置，供多个测试共用"""
+    return _get_optimizer().get_optimal_config(enable_gpu=enable_gpu)
 
-    try:
-        from core.converter import DoclingConverter, ConversionConfig
-        result.add_pass("converter导入")
-    except ImportError as e:
-        result.add_fail("converter导入", e)
 
-    try:
-        from utils.config import load_config, Config
-        result.add_pass("config导入")
-    except ImportError as e:
-        result.add_fail("config导入", e)
+def _find_patterns(content, patterns):
+    """
+    一次扫描找出内容中出现的所有模式（长模式优先匹配）
+
+    匹配不重叠，只出现在另一个模式内部的短模式不会被报告，
+    因此同一次检查中的模式不应互为子串
+    """
+    regex = re.compile("|".join(
+        re.escape(pattern) for pattern in sorted(patterns, key=len, reverse=True)
+    ))
+    return set(regex.findall(content))
+
 
+def _check_patterns(result, content, checks):
+    """按 (模式, 通过名, 失败名, 失败信息) 表检查文件内容"""
+    found = _find_patterns(content, [check[0] for check in checks])
+    for pattern, pass_name, fail_name, fail_message in checks:
+        if pattern in found:
+            result.add_pass(pass_name)
+        else:
+            result.add_fail(fail_name, fail_message)
+
+
+def _run_test(test):
+    """运行单个测试，未捕获的异常记为失败"""
     try:
-        from rich.console import Console
-        result.add_pass("rich导入")
-    except ImportError as e:
-        result.add_fail("rich导入", e)
+        return test()
+    except Exception as e:
+        result = TestResult(f"\n{test.__name__}...")
+        result.add_fail(test.__name__, f"{type(e).__name__}: {e}")
+        return result
+
+
+def test_imports():
+    """测试1：所有模块可以正常导入"""
+    result = TestResult("\n测试1: 模块导入...")
+
+    # 不同顶层包并行导入以重叠磁盘I/O；同一包内的子模块在同一线程中
+    # 依次导入，避免包的 __init__ 失败时其他线程看到半初始化的包
+    groups = {}
+    for spec in IMPORT_SPECS:
+        groups.setdefault(spec[1].partition(".")[0], []).append(spec)
+
+    with ThreadPoolExecutor(max_workers=len(groups)) as executor:
+        errors = dict(
+            item for items in executor.map(_import_specs, groups.values()) for item in items
+        )
+
+    # 按原顺序记录结果
+    for test_name, _, _ in IMPORT_SPECS:
+        error = errors[test_name]
+        if error is None:
+            result.add_pass(test_name)
+        else:
+            result.add_fail(test_name, error)
 
     return result
 
 
 def test_cpu_optimizer():
     """测试2：CPU优化器功能"""
-    print("\n测试2: CPU优化器...")
-
-    result = TestResult()
+    result = TestResult("\n测试2: CPU优化器...")
 
     try:
-        from core.cpu_optimizer import AMDCPUOptimizer
-
-        optimizer = AMDCPUOptimizer()
+        optimizer = _get_optimizer()
         result.add_pass("优化器初始化")
 
         # 测试系统检测
@@ -125,7 +186,7 @@ def test_cpu_optimizer():
         else:
             result.add_fail("workers计算", f"异常值: {workers}")
 
-        config = optimizer.get_optimal_config(enable_gpu=False)
+        config = _get_optimal_config(enable_gpu=False)
 
         if config.ocr_batch_size > 0:
             result.add_pass(f"计算最优batch_size: {config.ocr_batch_size}")
@@ -164,22 +225,20 @@ def test_cpu_optimizer():
 
 def test_performance_monitor():
     """测试3：性能监控器"""
-    print("\n测试3: 性能监控器...")
-
-    result = TestResult()
+    result = TestResult("\n测试3: 性能监控器...")
 
     try:
         from core.performance_monitor import PerformanceMonitor
         import time
 
-        monitor = PerformanceMonitor(sample_interval=0.5)
+        monitor = PerformanceMonitor(sample_interval=0.1)
         result.add_pass("监控器初始化")
 
         monitor.start()
         result.add_pass("监控器启动")
 
-        # 运行一小段时间
-        time.sleep(2)
+        # 运行一小段时间（stop() 会立即唤醒监控线程）
+        time.sleep(0.5)
 
         monitor.stop()
         result.add_pass("监控器停止")
@@ -203,43 +262,51 @@ def test_performance_monitor():
 
 def test_config_files():
     """测试4：配置文件"""
-    print("\n测试4: 配置文件...")
-
-    result = TestResult()
+    result = TestResult("\n测试4: 配置文件...")
 
     try:
         import yaml
 
+        # PyYAML 带 libyaml 时使用 C 加载器
+        yaml_loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
         # 测试96GB配置
         config_file_96gb = Path("config_amd_cpu_96gb.yaml")
         if config_file_96gb.exists():
             with open(config_file_96gb, 'r', encoding='utf-8') as f:
-                config_96gb = yaml.safe_load(f)
+                config_96gb = yaml.load(f, Loader=yaml_loader)
 
             result.add_pass("96GB配置文件加载")
 
+            # 展平一次，之后按 "section.key" 直接查找
+            flat = {
+                f"{section}.{key}": value
+                for section, values in config_96gb.items() if isinstance(values, dict)
+                for key, value in values.items()
+            }
+
             # 检查关键配置
-            if config_96gb['processing']['max_workers'] == 16:
+            if flat['processing.max_workers'] == 16:
                 result.add_pass("workers配置正确")
             else:
-                result.add_fail("workers配置", f"期望16, 实际{config_96gb['processing']['max_workers']}")
+                result.add_fail("workers配置", f"期望16, 实际{flat['processing.max_workers']}")
 
-            if config_96gb['performance']['num_threads'] == 32:
+            if flat['performance.num_threads'] == 32:
                 result.add_pass("num_threads配置正确")
             else:
-                result.add_fail("num_threads配置", f"期望32, 实际{config_96gb['performance']['num_threads']}")
+                result.add_fail("num_threads配置", f"期望32, 实际{flat['performance.num_threads']}")
 
-            if config_96gb['performance']['ocr_batch_size'] >= 32:
-                result.add_pass(f"batch_size配置: {config_96gb['performance']['ocr_batch_size']}")
+            if flat['performance.ocr_batch_size'] >= 32:
+                result.add_pass(f"batch_size配置: {flat['performance.ocr_batch_size']}")
             else:
                 result.add_fail("batch_size配置",
-                              f"过小: {config_96gb['performance']['ocr_batch_size']}")
+                              f"过小: {flat['performance.ocr_batch_size']}")
 
-            if config_96gb['performance']['max_process_memory_gb'] >= 60:
-                result.add_pass(f"内存限制配置: {config_96gb['performance']['max_process_memory_gb']}GB")
+            if flat['performance.max_process_memory_gb'] >= 60:
+                result.add_pass(f"内存限制配置: {flat['performance.max_process_memory_gb']}GB")
             else:
                 result.add_fail("内存限制配置",
-                              f"过小: {config_96gb['performance']['max_process_memory_gb']}GB")
+                              f"过小: {flat['performance.max_process_memory_gb']}GB")
 
         else:
             result.add_fail("96GB配置文件", "文件不存在")
@@ -259,17 +326,13 @@ def test_config_files():
 
 def test_converter_init():
     """测试5：转换器初始化"""
-    print("\n测试5: 转换器初始化...")
-
-    result = TestResult()
+    result = TestResult("\n测试5: 转换器初始化...")
 
     try:
         from core.converter import DoclingConverter, ConversionConfig
-        from core.cpu_optimizer import AMDCPUOptimizer
 
-        # 使用优化器获取配置
-        optimizer = AMDCPUOptimizer()
-        opt_config = optimizer.get_optimal_config(enable_gpu=False)
+        # 使用优化器获取配置（与测试2共用缓存的优化器）
+        opt_config = _get_optimal_config(enable_gpu=False)
 
         # 创建转换器配置
         config = ConversionConfig(
@@ -316,9 +379,7 @@ def test_converter_init():
 
 def test_cli_integration():
     """测试6：CLI集成"""
-    print("\n测试6: CLI集成...")
-
-    result = TestResult()
+    result = TestResult("\n测试6: CLI集成...")
 
     try:
         # 检查CLI文件
@@ -332,29 +393,13 @@ def test_cli_integration():
         # 读取CLI文件内容
         content = cli_file.read_text(encoding='utf-8')
 
-        # 检查是否有optimizer导入
-        if "from core.cpu_optimizer import AMDCPUOptimizer" in content:
-            result.add_pass("Optimizer导入检查")
-        else:
-            result.add_fail("Optimizer导入", "未找到导入语句")
-
-        # 检查是否有optimizer使用
-        if "AMDCPUOptimizer()" in content:
-            result.add_pass("Optimizer使用检查")
-        else:
-            result.add_fail("Optimizer使用", "未找到使用代码")
-
-        # 检查是否有table_batch_size配置
-        if "table_batch_size" in content:
-            result.add_pass("table_batch_size配置检查")
-        else:
-            result.add_fail("table_batch_size配置", "未找到配置代码")
-
-        # 检查是否有num_threads配置
-        if "num_threads" in content:
-            result.add_pass("num_threads配置检查")
-        else:
-            result.add_fail("num_threads配置", "未找到配置代码")
+        # 检查optimizer导入和使用、table_batch_size和num_threads配置
+        _check_patterns(result, content, [
+            ("from core.cpu_optimizer import AMDCPUOptimizer", "Optimizer导入检查", "Optimizer导入", "未找到导入语句"),
+            ("AMDCPUOptimizer()", "Optimizer使用检查", "Optimizer使用", "未找到使用代码"),
+            ("table_batch_size", "table_batch_size配置检查", "table_batch_size配置", "未找到配置代码"),
+            ("num_threads", "num_threads配置检查", "num_threads配置", "未找到配置代码"),
+        ])
 
     except Exception as e:
         result.add_fail("CLI集成测试", f"{type(e).__name__}: {e}")
@@ -364,9 +409,7 @@ def test_cli_integration():
 
 def test_benchmark_script():
     """测试7：基准测试脚本"""
-    print("\n测试7: 基准测试脚本...")
-
-    result = TestResult()
+    result = TestResult("\n测试7: 基准测试脚本...")
 
     try:
         # 检查基准测试脚本
@@ -381,20 +424,11 @@ def test_benchmark_script():
         content = benchmark_file.read_text(encoding='utf-8')
 
         # 检查关键类和函数
-        if "class CPUBenchmark" in content:
-            result.add_pass("CPUBenchmark类定义")
-        else:
-            result.add_fail("CPUBenchmark类", "未找到类定义")
-
-        if "def run_single_benchmark" in content:
-            result.add_pass("run_single_benchmark方法")
-        else:
-            result.add_fail("run_single_benchmark方法", "未找到方法")
-
-        if "AMDCPUOptimizer" in content:
-            result.add_pass("Optimizer集成")
-        else:
-            result.add_fail("Optimizer集成", "未找到集成代码")
+        _check_patterns(result, content, [
+            ("class CPUBenchmark", "CPUBenchmark类定义", "CPUBenchmark类", "未找到类定义"),
+            ("def run_single_benchmark", "run_single_benchmark方法", "run_single_benchmark方法", "未找到方法"),
+            ("AMDCPUOptimizer", "Optimizer集成", "Optimizer集成", "未找到集成代码"),
+        ])
 
     except Exception as e:
         result.add_fail("基准测试脚本", f"{type(e).__name__}: {e}")
@@ -408,16 +442,32 @@ def main():
     print(" " * 15 + "PDF2MD 完整系统测试")
     print("=" * 70)
 
-    all_results = []
+    # 先单独运行导入测试：core 包的 __init__ 导入失败时，并发导入的
+    # 其他线程会得到 KeyError 而不是真正的 ImportError
+    import_result = _run_test(test_imports)
+    import_result.print_output()
+
+    tests = [
+        test_cpu_optimizer,
+        test_performance_monitor,
+        test_config_files,
+        test_converter_init,
+        test_cli_integration,
+        test_benchmark_script,
+    ]
+
+    # core 已成功导入时其余测试各占一个线程并行运行，否则依次运行
+    if "core" in sys.modules:
+        with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+            results = list(executor.map(_run_test, tests))
+    else:
+        results = [_run_test(test) for test in tests]
+
+    # 按原顺序打印各测试缓存的输出
+    for result in results:
+        result.print_output()
 
-    # 运行所有测试
-    all_results.append(test_imports())
-    all_results.append(test_cpu_optimizer())
-    all_results.append(test_performance_monitor())
-    all_results.append(test_config_files())
-    all_results.append(test_converter_init())
-    all_results.append(test_cli_integration())
-    all_results.append(test_benchmark_script())
+    all_results = [import_result] + results
 
     # 汇总结果
     total_passed = sum(r.passed for r in all_results)
@@ -6,6 +6,8 @@
 
 import sys
 import time
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 
 # Ensure UTF-8 encoding
@@ -27,12 +29,30 @@ from rich.progress import (
 console = Console()
 
 
+@contextmanager
+def background_refresh(progress: Progress, interval: float = 0.1):
+    """在后台线程中定期刷新进度条（配合 auto_refresh=False 使用）"""
+    stop_event = threading.Event()
+
+    def refresh_loop():
+        while not stop_event.wait(interval):
+            progress.refresh()
+
+    thread = threading.Thread(target=refresh_loop, name="progress-refresh", daemon=True)
+    thread.start()
+    try:
+        yield progress
+    finally:
+        stop_event.set()
+        thread.join()
+        progress.refresh()
+
+
 def test_progress_updates():
     """测试进度条是否会更新"""
     console.print("\n[bold cyan]测试1: 模拟批处理进度更新[/bold cyan]\n")
 
     total_tasks = 5
-    completed_count = [0]
 
     with Progress(
         SpinnerColumn(),
@@ -40,8 +60,11 @@ def test_progress_updates():
         BarColumn(),
         TaskProgressColumn(),
         TextColumn("[bold cyan]{task.completed}[/bold cyan]/{task.total}"),
-        console=console
-    ) as progress:
+        console=console,
+        auto_refresh=False,  # 由后台线程统一刷新
+        transient=False,
+        expand=False
+    ) as progress, background_refresh(progress):
 
         task = progress.add_task(
             "Converting PDFs...",
@@ -49,17 +72,13 @@ def test_progress_updates():
         )
 
         def progress_callback(current: int, total: int, message: str):
-            # Update progress bar manually when callback is invoked
-            new_completed = current - completed_count[0]
-            console.print(f"[dim]回调被调用: current={current}, completed_count[0]={completed_count[0]}, new_completed={new_completed}[/dim]")
-            if new_completed > 0:
-                progress.update(task, advance=new_completed)
-                completed_count[0] = current
+            # Each call is one completed task, so no shared counter is read back
+            console.print(f"[dim]回调被调用: current={current}[/dim]")
+            progress.update(task, advance=1)
 
         # 模拟批处理调用回调
         for i in range(1, total_tasks + 1):
             time.sleep(0.5)
-            console.print(f"[yellow]处理任务 {i}/{total_tasks}...[/yellow]")
             progress_callback(i, total_tasks, f"Converted document_{i}.pdf")
 
     console.print("\n[green]OK 测试完成[/green]\n")
@@ -6,7 +6,9 @@
 
 import sys
 import time
+import queue
 import logging
+import threading
 from pathlib import Path
 
 # Ensure UTF-8 encoding
@@ -34,19 +36,64 @@ from rich.progress import (
 console = Console()
 
 
-def simulate_docling_logging():
-    """模拟 docling 的日志输出"""
-    docling_logger = logging.getLogger('docling')
-    rapidocr_logger = logging.getLogger('RapidOCR')
+class ProgressDaemon(threading.Thread):
+    """
+    独立的进度条刷新线程
+
+    工作线程只调用 publish() 发布增量，守护线程按固定间隔汇总后
+    每个任务只调用一次 progress.update，工作线程不再等待渲染锁
+    """
+
+    def __init__(self, progress: Progress, interval: float = 0.1):
+        super().__init__(name="progress-daemon", daemon=True)
+        self.progress = progress
+        self.interval = interval
+        self._updates = queue.SimpleQueue()
+        self._stop_event = threading.Event()
+
+    def publish(self, task_id, delta: int = 1):
+        """发布进度增量（线程安全，不阻塞）"""
+        self._updates.put((task_id, delta))
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            self._drain()
+        self._drain()
+
+    def stop(self):
+        """停止刷新线程，并应用所有剩余的增量"""
+        self._stop_event.set()
+        self.join()
+
+    def _drain(self):
+        totals = {}
+        while True:
+            try:
+                task_id, delta = self._updates.get_nowait()
+            except queue.Empty:
+                break
+            totals[task_id] = totals.get(task_id, 0) + delta
+
+        for task_id, delta in totals.items():
+            self.progress.update(task_id, advance=delta)
+
+
+# 模拟的 docling / RapidOCR 日志: (logger, message)
+_SIMULATED_LOG_LINES = (
+    (logging.getLogger('docling'), "Going to convert document batch..."),
+    (logging.getLogger('docling'), "Initializing pipeline for StandardPdfPipeline"),
+    (logging.getLogger('docling'), "Loading plugin 'docling_defaults'"),
+    (logging.getLogger('docling'), "Registered ocr engines: ['auto', 'easyocr', ...]"),
+    (logging.getLogger('RapidOCR'), "[RapidOCR] Using engine_name: torch"),
+    (logging.getLogger('RapidOCR'), "[RapidOCR] Using CPU device"),
+)
 
-    # 模拟各种日志
-    docling_logger.info("Going to convert document batch...")
-    docling_logger.info("Initializing pipeline for StandardPdfPipeline")
-    docling_logger.info("Loading plugin 'docling_defaults'")
-    docling_logger.info("Registered ocr engines: ['auto', 'easyocr', ...]")
 
-    rapidocr_logger.info("[RapidOCR] Using engine_name: torch")
-    rapidocr_logger.info("[RapidOCR] Using CPU device")
+def simulate_docling_logging():
+    """模拟 docling 的日志输出"""
+    for log, message in _SIMULATED_LOG_LINES:
+        # 惰性格式化：级别被调高时在 isEnabledFor 处直接返回
+        log.info("%s", message)
 
 
 def test_with_logging_noise():
@@ -62,14 +109,13 @@ def test_with_logging_noise():
     ]
 
     total_tasks = len(tasks)
-    completed_count = [0]
 
     console.print(f"[cyan]准备处理 {total_tasks} 个任务...[/cyan]\n")
 
     # 启用日志干扰测试
     console.print("[yellow]启用详细日志输出 (模拟真实场景)...[/yellow]\n")
 
-    # Reduce log noise during batch processing
+    # Reduce log noise during batch processing (same loggers as src/cli.py)
     docling_logger = logging.getLogger('docling')
     rapidocr_logger = logging.getLogger('RapidOCR')
     old_docling_level = docling_logger.level
@@ -95,23 +141,21 @@ def test_with_logging_noise():
                 total=total_tasks
             )
 
-            def progress_callback(current: int, total: int, message: str):
-                new_completed = current - completed_count[0]
-                if new_completed > 0:
-                    progress.update(task, advance=new_completed)
-                    completed_count[0] = current
-
-            # 模拟批处理
-            for i, task_name in enumerate(tasks, 1):
-                # 模拟 docling 日志输出（这些会被抑制）
-                simulate_docling_logging()
+            # 进度条由独立线程刷新，转换循环只发布增量
+            daemon = ProgressDaemon(progress)
+            daemon.start()
 
-                time.sleep(1.0)  # 模拟转换耗时
+            try:
+                # 模拟批处理
+                for task_name in tasks:
+                    # 模拟 docling 日志输出（这些会被抑制）
+                    simulate_docling_logging()
 
-                # 输出进度更新
-                console.print(f"[green]✓ 完成: {task_name}[/green]")
+                    time.sleep(1.0)  # 模拟转换耗时
 
-                progress_callback(i, total_tasks, f"Converted {task_name}")
+                    daemon.publish(task, 1)
+            finally:
+                daemon.stop()
 
     finally:
         # 恢复日志级别
@@ -133,7 +177,6 @@ def test_without_logging_fix():
     time.sleep(2)
 
     total_tasks = 3
-    completed_count = [0]
 
     with Progress(
         SpinnerColumn(),
@@ -150,16 +193,13 @@ def test_without_logging_fix():
             total=total_tasks
         )
 
-        for i in range(1, total_tasks + 1):
+        for _ in range(total_tasks):
             # 不降低日志级别，模拟日志干扰
             simulate_docling_logging()
 
             time.sleep(0.5)
 
-            new_completed = i - completed_count[0]
-            if new_completed > 0:
-                progress.update(task, advance=new_completed)
-                completed_count[0] = i
+            progress.update(task, advance=1)
 
     console.print("\n[dim]对比测试完成 - 注意上面的日志是否淹没了进度条[/dim]\n")
 